@@ -4,60 +4,159 @@ Documentation Link Checker
 Verifies all markdown internal links are valid
 """
 
+import mmap
 import os
+import queue
 import re
 import sys
+import threading
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+# Threads used to list directories while walking the tree
+DIR_WALK_WORKERS = 8
+
+def _scan_dir(path, exclude_dirs):
+    """List one directory with os.scandir, returning (subdirs, md_files)"""
+    subdirs = []
+    md_files = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.md') and entry.is_file():
+                md_files.append(entry.path)
+    return subdirs, md_files
+
+def parallel_find_markdown_files(root_dir, exclude_dirs, workers=DIR_WALK_WORKERS):
+    """Find markdown files, listing directories on a thread pool (os.walk order)"""
+    pending = queue.Queue()
+    listing = {}
+    errors = []
+    
+    def worker():
+        while True:
+            path = pending.get()
+            if path is None:
+                pending.task_done()
+                return
+            try:
+                try:
+                    subdirs, md_files = _scan_dir(path, exclude_dirs)
+                except OSError:
+                    subdirs, md_files = [], []
+                listing[path] = (subdirs, md_files)
+                for subdir in subdirs:
+                    pending.put(subdir)
+            except Exception as e:
+                # Re-raised after the walk; the thread keeps serving the queue
+                errors.append(e)
+            finally:
+                # Always count the item done, or pending.join() never returns
+                pending.task_done()
+    
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    pending.put(root_dir)
+    pending.join()
+    for _ in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    
+    # Reassemble in pre-order so results are deterministic
+    result = []
+    stack = [root_dir]
+    while stack:
+        subdirs, md_files = listing[stack.pop()]
+        result.extend(md_files)
+        stack.extend(reversed(subdirs))
+    return result
+
 def find_markdown_files(root_dir='.'):
     """Find all markdown files"""
     exclude_dirs = {'node_modules', '.git', '.ai_workflow', 'coverage'}
-    md_files = []
+    return parallel_find_markdown_files(root_dir, exclude_dirs)
+
+# Markdown link to a .md target: [text](path.md#anchor), matched on raw bytes.
+# Character classes exclude newlines so a whole-file scan never spans lines.
+LINK_PATTERN = re.compile(rb'\[([^\]\n]+)\]\(([^\)\n]+\.md[^\)\n]*)\)')
+
+NEWLINE_PATTERN = re.compile(rb'\n')
+
+# Worker cap for the file scan (I/O + regex bound, embarrassingly parallel)
+MAX_WORKERS = min(16, os.cpu_count() or 1)
+
+# Threads for target existence checks (pure I/O, so not tied to core count)
+STAT_WORKERS = 32
+
+def _scan_file(md_file):
+    """Scan a single markdown file, returning (source, line, link, target) occurrences"""
+    occurrences = []
+    
+    # Memory-map the file and scan it once; only matched link targets are decoded
+    with open(md_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return occurrences
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Cheap substring prefilter: most files contain no link at all
+            if mm.find(b'](') == -1:
+                return occurrences
+            
+            newlines = [m.start() for m in NEWLINE_PATTERN.finditer(mm)]
+            matches = [(m.start(), m.group(2)) for m in LINK_PATTERN.finditer(mm)]
     
-    for root, dirs, files in os.walk(root_dir):
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
-        for file in files:
-            if file.endswith('.md'):
-                md_files.append(os.path.join(root, file))
+    source_dir = os.path.dirname(md_file)
+    
+    for pos, raw_link in matches:
+        link = raw_link.decode('utf-8', 'ignore')
+        
+        # Skip external links and anchors
+        if link.startswith(('http://', 'https://', '#')):
+            continue
+        
+        # Remove anchor
+        link_path = link.split('#')[0]
+        
+        # Resolve path
+        target_path = os.path.normpath(os.path.join(source_dir, link_path))
+        
+        occurrences.append((md_file, bisect_left(newlines, pos) + 1, link_path, target_path))
     
-    return md_files
+    return occurrences
 
 def check_links(md_files):
     """Check all internal markdown links"""
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^\)]+\.md[^\)]*)\)')
-    broken = []
-    total = 0
+    # Pass 1: collect every link occurrence (parallel across files)
+    occurrences = []
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for file_occurrences in executor.map(_scan_file, md_files, chunksize=8):
+            occurrences.extend(file_occurrences)
     
-    for md_file in md_files:
-        with open(md_file, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        for line_num, line in enumerate(lines, 1):
-            matches = link_pattern.findall(line)
-            for text, link in matches:
-                # Skip external links and anchors
-                if link.startswith(('http://', 'https://', '#')):
-                    continue
-                
-                total += 1
-                
-                # Remove anchor
-                link_path = link.split('#')[0]
-                
-                # Resolve path
-                source_dir = os.path.dirname(md_file)
-                target_path = os.path.normpath(os.path.join(source_dir, link_path))
-                
-                # Check existence
-                if not os.path.exists(target_path):
-                    broken.append({
-                        'source': md_file,
-                        'line': line_num,
-                        'link': link_path,
-                        'target': target_path
-                    })
+    # Pass 2: stat each unique target once, however many files link to it.
+    # os.path.exists releases the GIL, so threads overlap the stat latency.
+    unique_targets = list({target for _, _, _, target in occurrences})
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+        exists_map = dict(zip(unique_targets, executor.map(os.path.exists, unique_targets)))
+    
+    # Pass 3: materialize broken links from the occurrence list
+    broken = [
+        {
+            'source': source,
+            'line': line_num,
+            'link': link_path,
+            'target': target_path
+        }
+        for source, line_num, link_path, target_path in occurrences
+        if not exists_map[target_path]
+    ]
     
-    return broken, total
+    return broken, len(occurrences)
 
 def main():
     print("Checking documentation links...\n")
@@ -16,10 +16,22 @@ Date: 2026-03-10
 """
 
 import os
+import queue
 import re
 import sys
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, NamedTuple, Set, Tuple, Optional
+
+# Optional linear-time regex engine (google-re2 / pyre2). RE2 has no lookaround
+# support, so it is used only for patterns without it; falls back to re.
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = re
 
 # ANSI color codes
 GREEN = '\033[0;32m'
@@ -73,11 +85,260 @@ EXCLUDE_DIRECTORIES = {
     'coverage', '.jest-cache', 'venv', '.husky'
 }
 
+# Threads used to list directories while walking the tree
+DIR_WALK_WORKERS = 8
+
+# Markdown link URL  [text](url)  — captures everything inside parens (single line)
+MD_LINK_PATTERN = re_fast.compile(rb'\[(?:[^\]\n]*)\]\(([^)\n]+)\)')
+
+# Bare path references: /path, ./path, ../path (uses lookarounds, so always stdlib re).
+# The path body is possessive (*+, Python 3.11+): it can never be followed by a class
+# character, so giving characters back is pointless and is ruled out up front. The
+# prefix and extension alternations are factored to shrink per-position branching.
+BARE_PATH_PATTERN = re.compile(
+    rb'(?<![`\w/.\x80-\xff])(\.{0,2}/)([a-zA-Z0-9_][a-zA-Z0-9_/-]*+)'
+    rb'\.(md|jsx?|json|txt|html|css|sh|py|tsx?)(?![`\w/\x80-\xff])'
+)
+
+# Fenced code block delimiter at the start of a line (after optional indentation)
+FENCE_PATTERN = re.compile(rb'^[^\S\n]*```', re.MULTILINE)
+
+NEWLINE_PATTERN = re.compile(rb'\n')
+
 # Broken reference classification labels
 LABEL_MOVED = 'MOVED'
 LABEL_TRULY_MISSING = 'TRULY_MISSING'
 
 
+def _union(patterns: List[str]):
+    """Compile a list of regex strings into a single bytes alternation (RE2 when available)."""
+    return re_fast.compile('|'.join(f'(?:{p})' for p in patterns).encode())
+
+
+def _scan_dir(path: str, exclude_dirs: Set[str]) -> Tuple[List[str], List[str]]:
+    """
+    List one directory with os.scandir, returning (subdirs, md_files).
+    Entries are classified from the cached d_type instead of a separate stat.
+    """
+    subdirs: List[str] = []
+    md_files: List[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.md') and entry.is_file():
+                md_files.append(entry.path)
+    return subdirs, md_files
+
+
+def parallel_find_markdown_files(root_dir: str, exclude_dirs: Set[str],
+                                 workers: int = DIR_WALK_WORKERS) -> List[str]:
+    """
+    Find markdown files under root_dir, listing directories on a thread pool.
+    scandir releases the GIL, so subdirectories are listed concurrently; the
+    result is reassembled in os.walk (pre-order) order to stay deterministic.
+    """
+    pending: queue.Queue = queue.Queue()
+    listing: Dict[str, Tuple[List[str], List[str]]] = {}
+
+    def worker() -> None:
+        while True:
+            path = pending.get()
+            if path is None:
+                pending.task_done()
+                return
+            try:
+                subdirs, md_files = _scan_dir(path, exclude_dirs)
+            except OSError:
+                subdirs, md_files = [], []
+            listing[path] = (subdirs, md_files)
+            for subdir in subdirs:
+                pending.put(subdir)
+            pending.task_done()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    pending.put(root_dir)
+    pending.join()
+    for _ in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+
+    result: List[str] = []
+    stack = [root_dir]
+    while stack:
+        subdirs, md_files = listing[stack.pop()]
+        result.extend(md_files)
+        stack.extend(reversed(subdirs))
+    return result
+
+
+# Exclusion patterns fused into one alternation per target (reference vs. line),
+# compiled at import so every worker process shares the same precompiled globals
+PATTERN_EXCLUDE = _union(
+    EXCLUDE_REGEX_PATTERNS + EXCLUDE_COMMENT_PATTERNS + EXCLUDE_CODE_PATTERNS +
+    EXCLUDE_URL_PATTERNS + EXCLUDE_SPECIAL_PATTERNS
+)
+LINE_EXCLUDE = _union(EXCLUDE_REGEX_PATTERNS + EXCLUDE_DESCRIPTION_PATTERNS)
+
+# Memoized path resolution and existence checks (per process; same refs recur across files).
+# Keyed by plain strings to avoid building Path objects on the hot path.
+_RESOLVE_CACHE: Dict[Tuple[str, str], str] = {}
+_EXISTS_CACHE: Dict[str, bool] = {}
+
+
+class Stats(NamedTuple):
+    """Per-file scan result merged by ReferenceChecker."""
+    total: int
+    valid: int
+    excluded: int
+    broken: List[Tuple[str, int, str, str]]  # (source, line_num, ref, resolved)
+    excluded_refs: List[str]
+    error: Optional[str]
+
+
+def should_exclude(line: bytes, pattern: bytes) -> bool:
+    """
+    Check if pattern should be excluded as false positive (raw bytes).
+    Fenced code blocks are already skipped by scan_file's fence ranges.
+    """
+
+    # Reference-side patterns (regex, comment, code, URL, special), then line-side
+    # patterns (regex, description)
+    return bool(PATTERN_EXCLUDE.search(pattern) or LINE_EXCLUDE.search(line))
+
+
+def _resolve(root_dir: str, parent: str, ref: str) -> str:
+    """
+    Resolve a reference relative to its source directory (memoized).
+    Uses lexical os.path normalization; root_dir is already a resolved path.
+    """
+    key = (parent, ref)
+    target = _RESOLVE_CACHE.get(key)
+    if target is None:
+        # Resolve path relative to file location
+        if ref.startswith('/'):
+            target = os.path.join(root_dir, ref.lstrip('/'))
+        else:
+            target = os.path.join(parent, ref)
+        target = _RESOLVE_CACHE[key] = os.path.normpath(target)
+    return target
+
+
+def _exists(path: str) -> bool:
+    """Memoized os.path.exists() for targets referenced from many files."""
+    exists = _EXISTS_CACHE.get(path)
+    if exists is None:
+        exists = _EXISTS_CACHE[path] = os.path.exists(path)
+    return exists
+
+
+def scan_file(file_path: Path, root_dir: Path) -> Stats:
+    """Extract and validate file references from a file.
+
+    Module-level (picklable) so it can run in ProcessPoolExecutor workers;
+    broken references are returned unclassified for the parent to classify.
+
+    Detects two reference forms:
+    1. Markdown links: [text](path/to/file.md) — covers bare paths like .github/CONTRIBUTING.md
+    2. Bare path references: ./path, ../path, /path — for inline mentions
+    """
+    # Read raw bytes: all patterns are ASCII, so only matched refs are decoded
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    except Exception as e:
+        return Stats(0, 0, 0, [], [], f"Could not read {file_path}: {e}")
+
+    # Offset of the first character of each line; line N starts at line_starts[N - 1]
+    line_starts = [0]
+    line_starts.extend(m.end() for m in NEWLINE_PATTERN.finditer(content))
+
+    # Fenced code blocks as flat [open, close, open, close, ...] byte offsets, from the
+    # start of the opening fence line to the end of the closing one (EOF if unclosed).
+    # An offset is inside a block when an odd number of boundaries are <= it.
+    fence_bounds: List[int] = []
+    if b'```' in content:
+        for idx, m in enumerate(FENCE_PATTERN.finditer(content)):
+            if idx % 2 == 0:
+                fence_bounds.append(m.start())
+            else:
+                line_end = content.find(b'\n', m.end())
+                fence_bounds.append(line_end + 1 if line_end != -1 else len(content))
+
+    # Run both patterns once over the whole file, then group candidates by line
+    # (markdown links before bare paths, in position order, as per-line scanning did).
+    # Substring prefilters skip a pattern entirely when its marker never occurs.
+    by_line: Dict[int, List[bytes]] = {}
+    matches = []
+    if b'](' in content:
+        matches.extend((bisect_right(line_starts, m.start()), 0, m.start(), m)
+                       for m in MD_LINK_PATTERN.finditer(content))
+    if b'/' in content:
+        matches.extend((bisect_right(line_starts, m.start()), 1, m.start(), m)
+                       for m in BARE_PATH_PATTERN.finditer(content))
+    matches.sort(key=lambda item: item[:3])
+    for line_num, kind, pos, match in matches:
+        if bisect_right(fence_bounds, pos) % 2 == 1:
+            continue
+        if kind == 0:
+            ref = match.group(1).strip().split(b' ')[0]  # strip optional title
+        else:
+            ref = match.group(1) + match.group(2) + b'.' + match.group(3)
+        by_line.setdefault(line_num, []).append(ref)
+
+    source = str(file_path)
+    parent = os.path.dirname(source)
+    root = str(root_dir)
+    total = valid = excluded = 0
+    broken: List[Tuple[str, int, str, str]] = []
+    excluded_refs: List[str] = []
+    seen_on_line: Set[str] = set()
+
+    for line_num, candidates in by_line.items():
+        seen_on_line.clear()
+        line_end = line_starts[line_num] if line_num < len(line_starts) else len(content)
+        line = content[line_starts[line_num - 1]:line_end]
+
+        for raw_ref in candidates:
+            ref = raw_ref.decode('utf-8', 'ignore')
+
+            # Skip external URLs and anchors
+            if should_exclude(line, raw_ref):
+                excluded += 1
+                excluded_refs.append(f"{file_path}:{line_num}: {ref} (excluded pattern)")
+                continue
+
+            # Skip anchor-only links and non-file references
+            if ref.startswith('#') or '://' in ref or ref.startswith('mailto:'):
+                continue
+
+            # Only process references to known file extensions
+            file_ext = os.path.splitext(ref)[1].lower()
+            if file_ext not in {'.md', '.js', '.json', '.txt', '.html',
+                                '.css', '.sh', '.py', '.jsx', '.ts', '.tsx'}:
+                continue
+
+            # Deduplicate within same line
+            if ref in seen_on_line:
+                continue
+            seen_on_line.add(ref)
+
+            total += 1
+
+            target = _resolve(root, parent, ref)
+
+            if _exists(target):
+                valid += 1
+            else:
+                broken.append((source, line_num, ref, target))
+
+    return Stats(total, valid, excluded, broken, excluded_refs, None)
+
+
 class BrokenRef:
     """Represents a single broken reference with its classification."""
 
@@ -145,151 +406,38 @@ class ReferenceChecker:
     
     def should_exclude(self, line: str, pattern: str) -> bool:
         """Check if pattern should be excluded as false positive"""
-        
-        # Check if in code block
-        if line.strip().startswith('```'):
-            return True
-        
-        # Check regex patterns
-        for regex_pattern in EXCLUDE_REGEX_PATTERNS:
-            if re.search(regex_pattern, pattern) or re.search(regex_pattern, line):
-                return True
-        
-        # Check comment patterns
-        for comment_pattern in EXCLUDE_COMMENT_PATTERNS:
-            if re.search(comment_pattern, pattern):
-                return True
-        
-        # Check description patterns
-        for desc_pattern in EXCLUDE_DESCRIPTION_PATTERNS:
-            if re.search(desc_pattern, line):
-                return True
-        
-        # Check code patterns
-        for code_pattern in EXCLUDE_CODE_PATTERNS:
-            if re.search(code_pattern, pattern):
-                return True
-        
-        # Check URL patterns
-        for url_pattern in EXCLUDE_URL_PATTERNS:
-            if re.search(url_pattern, pattern):
-                return True
-        
-        # Check special patterns
-        for special_pattern in EXCLUDE_SPECIAL_PATTERNS:
-            if re.search(special_pattern, pattern):
-                return True
-        
-        return False
-    
-    def extract_references(self, file_path: Path) -> None:
-        """Extract and validate file references from a file.
-
-        Detects two reference forms:
-        1. Markdown links: [text](path/to/file.md) — covers bare paths like .github/CONTRIBUTING.md
-        2. Bare path references: ./path, ../path, /path — for inline mentions
-        """
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except Exception as e:
-            print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
-            return
-
-        in_code_block = False
-
-        # Pattern 1: Markdown link URL  [text](url)  — captures everything inside parens
-        md_link_pattern = re.compile(r'\[(?:[^\]]*)\]\(([^)]+)\)')
-
-        # Pattern 2: Bare path references: /path, ./path, ../path
-        bare_path_pattern = re.compile(
-            r'(?<![`\w/.])(\./|\.\./|/)([a-zA-Z0-9_][a-zA-Z0-9_/-]*)'
-            r'\.(md|js|json|txt|html|css|sh|py|jsx|ts|tsx)(?![`\w/])'
-        )
-
-        seen_on_line: Set[str] = set()
-
-        for line_num, line in enumerate(lines, 1):
-            # Track code block state
-            if line.strip().startswith('```'):
-                in_code_block = not in_code_block
-                continue
+        return should_exclude(line.encode('utf-8'), pattern.encode('utf-8'))
 
-            if in_code_block:
-                continue
+    def extract_references(self, file_path: Path) -> None:
+        """Extract and validate file references from a file (see scan_file)."""
+        self._merge(scan_file(file_path, self.root_dir))
+
+    def _merge(self, stats: Stats) -> None:
+        """Fold one file's scan results into the running totals, classifying broken refs."""
+        if stats.error:
+            print(f"{YELLOW}⚠️  {stats.error}{NC}")
+        self.total_references += stats.total
+        self.valid_references += stats.valid
+        self.excluded_patterns += stats.excluded
+        self.excluded_refs.extend(stats.excluded_refs)
+        for source, line_num, ref, resolved in stats.broken:
+            target = Path(resolved)
+            classification, alternative = self._classify_broken_ref(target)
+            self.broken_references += 1
+            self.broken_refs.append(BrokenRef(
+                source=source,
+                line_num=line_num,
+                ref=ref,
+                resolved=target,
+                classification=classification,
+                alternative=alternative,
+            ))
 
-            seen_on_line.clear()
-
-            # Collect all candidate refs from both patterns
-            candidates: List[str] = []
-
-            for match in md_link_pattern.finditer(line):
-                url = match.group(1).strip().split(' ')[0]  # strip optional title
-                candidates.append(url)
-
-            for match in bare_path_pattern.finditer(line):
-                ref = match.group(1) + match.group(2) + '.' + match.group(3)
-                candidates.append(ref)
-
-            for ref in candidates:
-                # Skip external URLs and anchors
-                if self.should_exclude(line, ref):
-                    self.excluded_patterns += 1
-                    self.excluded_refs.append(f"{file_path}:{line_num}: {ref} (excluded pattern)")
-                    continue
-
-                # Skip anchor-only links and non-file references
-                if ref.startswith('#') or '://' in ref or ref.startswith('mailto:'):
-                    continue
-
-                # Only process references to known file extensions
-                file_ext = Path(ref).suffix.lower()
-                if file_ext not in {'.md', '.js', '.json', '.txt', '.html',
-                                    '.css', '.sh', '.py', '.jsx', '.ts', '.tsx'}:
-                    continue
-
-                # Deduplicate within same line
-                if ref in seen_on_line:
-                    continue
-                seen_on_line.add(ref)
-
-                self.total_references += 1
-
-                # Resolve path relative to file location
-                if ref.startswith('/'):
-                    target = self.root_dir / ref.lstrip('/')
-                else:
-                    target = file_path.parent / ref
-
-                try:
-                    target = target.resolve()
-                except Exception:
-                    pass
-
-                if target.exists():
-                    self.valid_references += 1
-                else:
-                    classification, alternative = self._classify_broken_ref(target)
-                    self.broken_references += 1
-                    self.broken_refs.append(BrokenRef(
-                        source=str(file_path),
-                        line_num=line_num,
-                        ref=ref,
-                        resolved=target,
-                        classification=classification,
-                        alternative=alternative,
-                    ))
-    
     def find_markdown_files(self) -> List[Path]:
         """Find all markdown files to scan and pre-build the repo file index."""
-        md_files = []
-
-        for root, dirs, files in os.walk(self.root_dir):
-            dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRECTORIES]
-
-            for file in files:
-                if file.endswith('.md'):
-                    md_files.append(Path(root) / file)
+        md_files = [
+            Path(p) for p in parallel_find_markdown_files(str(self.root_dir), EXCLUDE_DIRECTORIES)
+        ]
 
         # Pre-build index so first broken ref doesn't pay full scan cost
         self._repo_file_index = self._build_repo_file_index()
@@ -335,10 +483,12 @@ class ReferenceChecker:
         md_files = self.find_markdown_files()
         print(f"Found {len(md_files)} markdown files to scan\n")
 
-        for idx, file_path in enumerate(md_files, 1):
-            if idx % 10 == 0:
-                print(f"{BLUE}Processing: {idx}/{len(md_files)} files...{NC}")
-            self.extract_references(file_path)
+        scan = partial(scan_file, root_dir=self.root_dir)
+        with ProcessPoolExecutor() as executor:
+            for idx, stats in enumerate(executor.map(scan, md_files, chunksize=16), 1):
+                if idx % 10 == 0:
+                    print(f"{BLUE}Processing: {idx}/{len(md_files)} files...{NC}")
+                self._merge(stats)
 
         # --- Summary ---
         print(f"\n{BLUE}==========================================")
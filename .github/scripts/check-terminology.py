@@ -60,6 +60,24 @@ CHECKS = [
     }
 ]
 
+def _matcher(pattern):
+    """Compile pattern and return its test method: match() if ^-anchored, else search()"""
+    compiled = re.compile(pattern)
+    return compiled.match if pattern.startswith('^') else compiled.search
+
+# Precompiled (exclude test, message) pairs, built once at load time; the
+# patterns themselves are matched through MASTER_RE
+COMPILED_CHECKS = [
+    (
+        _matcher(check['exclude_pattern']) if 'exclude_pattern' in check else None,
+        check['message']
+    )
+    for check in CHECKS
+]
+
+# Single alternation of all check patterns; group g<i> maps back to COMPILED_CHECKS[i]
+MASTER_RE = re.compile('|'.join(f"(?P<g{i}>{check['pattern']})" for i, check in enumerate(CHECKS)))
+
 def check_file(file_path):
     """Check terminology in a single file"""
     try:
@@ -70,35 +88,38 @@ def check_file(file_path):
         print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
         return 0
     
-    issues = 0
+    # Collect (check index, line number) hits in one pass over the lines
+    hits = set()
     
-    for check in CHECKS:
-        pattern = re.compile(check['pattern'])
-        exclude = re.compile(check['exclude_pattern']) if 'exclude_pattern' in check else None
+    for line_num, line in enumerate(lines, 1):
+        # Skip if in code block
+        if line.strip().startswith('```') or line.strip().startswith('    '):
+            continue
         
-        for line_num, line in enumerate(lines, 1):
-            # Skip if in code block
-            if line.strip().startswith('```') or line.strip().startswith('    '):
+        for match in MASTER_RE.finditer(line):
+            idx = int(match.lastgroup[1:])
+            if (idx, line_num) in hits:
                 continue
             
-            # Check for pattern
-            if pattern.search(line):
-                # Check if should be excluded
-                if exclude and exclude.search(line):
-                    continue
-                
-                # Found an issue
-                if issues == 0:  # First issue in file
-                    print(f"{YELLOW}⚠️  {file_path}{NC}")
-                
-                print(f"   Line {line_num}: {check['message']}")
-                print(f"   Found: {line.strip()[:80]}")
-                issues += 1
+            # Check if should be excluded
+            exclude = COMPILED_CHECKS[idx][0]
+            if exclude and exclude(line):
+                continue
+            
+            hits.add((idx, line_num))
+    
+    # Report grouped by check, as before
+    for issues, (idx, line_num) in enumerate(sorted(hits)):
+        if issues == 0:  # First issue in file
+            print(f"{YELLOW}⚠️  {file_path}{NC}")
+        
+        print(f"   Line {line_num}: {COMPILED_CHECKS[idx][1]}")
+        print(f"   Found: {lines[line_num - 1].strip()[:80]}")
     
-    if issues > 0:
+    if hits:
         print()  # Blank line after file issues
     
-    return issues
+    return len(hits)
 
 def main():
     if len(sys.argv) < 2 or '--help' in sys.argv or '-h' in sys.argv:
@@ -0,0 +1,59 @@
+"""
+Local HTTP server for the Guia Turístico sources in ``src/``.
+
+Every integration test resolves the application URL through ``base_url()``:
+the conftest.py fixture under pytest, and the test classes' ``setUpClass``
+in plain ``unittest`` runs.
+
+Usage:
+    from app_server import base_url
+
+    driver.get(f"{base_url()}/index.html")
+"""
+
+import atexit
+import functools
+import http.server
+import os
+import threading
+from pathlib import Path
+
+# Application sources served to the browser
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+class _QuietRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request to stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+@functools.cache
+def base_url():
+    """
+    Base URL of the application, without a trailing slash.
+
+    ``GUIA_BASE_URL`` points the tests at another server. Otherwise ``src/``
+    is served over HTTP from a background thread on a free 127.0.0.1 port,
+    started on first use and stopped at interpreter exit. Unlike ``file://``
+    URLs, this lets the browser cache stylesheets and scripts between page
+    loads.
+
+    Returns:
+        str: Base URL for local testing
+    """
+    external = os.getenv("GUIA_BASE_URL")
+    if external:
+        return external.rstrip("/")
+
+    handler = functools.partial(_QuietRequestHandler, directory=str(SRC_DIR))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    atexit.register(_stop, server)
+    return f"http://127.0.0.1:{server.server_address[1]}"
@@ -4,19 +4,70 @@ pytest configuration and fixtures for Guia Turístico integration tests.
 Provides shared fixtures including Firefox WebDriver with console log capture.
 """
 
+import os
+import time
+
 import pytest
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
 
+from app_server import base_url as app_base_url
 from firefox_console_capture import FirefoxConsoleCapture, ConsoleConfig
 
+# Session-wide async script timeout in seconds
+SCRIPT_TIMEOUT = 2
 
-@pytest.fixture(scope="function")
+# Session-wide page load timeout in seconds (geckodriver defaults to 300)
+PAGE_LOAD_TIMEOUT = 30
+
+# How long a primary_browser probe result is reused across sessions, in seconds
+PRIMARY_BROWSER_TTL = 3600
+
+# Set BLOCK_EXTERNAL_HOSTS=true to keep the browsers off the network except
+# for localhost. Off by default: the app imports modules from a CDN and some
+# tests use the live Nominatim API.
+BLOCK_EXTERNAL_HOSTS = os.getenv("BLOCK_EXTERNAL_HOSTS", "false").lower() == "true"
+
+# Resets the already-loaded page in place; returns false if the browser is
+# no longer on the expected page and a real navigation is needed
+_RESET_PAGE_JS = """
+if (location.href !== arguments[0]) {
+    return false;
+}
+history.replaceState(null, '', location.pathname);
+return true;
+"""
+
+
+def pytest_configure(config):
+    # Registered here so the mark is known with or without pytest-xdist
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on one xdist worker (with --dist loadgroup)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "fresh_page: navigate to index_page anew instead of resetting it in place",
+    )
+    config.addinivalue_line(
+        "markers",
+        "keep_page: leave the loaded page in place after the test for the next one to reuse",
+    )
+
+
+@pytest.fixture(scope="session")
 def firefox_driver():
     """
     Provide Firefox WebDriver instance with console logging enabled.
 
+    The browser is started once per session to amortize Firefox startup;
+    per-test state is cleared by the autouse ``_reset_session_drivers`` fixture.
+    Under pytest-xdist each worker process runs its own session, so every
+    worker gets its own Firefox and geckodriver (on a free port).
+
     Yields:
         webdriver.Firefox: Configured Firefox driver instance
 
@@ -30,19 +81,55 @@ def firefox_driver():
     # Enable console logging
     firefox_options.set_preference("devtools.console.stdout.content", True)
 
+    # WebDriver BiDi lets the console listener run as a preload script
+    firefox_options.enable_bidi = True
+
     # Grant geolocation permission for Guia Turístico tests
+    firefox_options.set_preference("geo.enabled", True)
+    firefox_options.set_preference("geo.provider.use_corelocation", False)
     firefox_options.set_preference("geo.prompt.testing", True)
     firefox_options.set_preference("geo.prompt.testing.allow", True)
 
-    # Headless mode for CI/CD (can be overridden with environment variable)
-    import os
+    # No notification or push prompts
+    firefox_options.set_preference("dom.webnotifications.enabled", False)
+    firefox_options.set_preference("dom.push.enabled", False)
+
+    # One content process and no UI animations are plenty for these tests
+    firefox_options.set_preference("dom.ipc.processCount", 1)
+    firefox_options.set_preference("toolkit.cosmeticAnimations.enabled", False)
 
-    if os.getenv("HEADLESS", "false").lower() == "true":
+    # The tests inspect text, layout and computed styles, never pixels, so
+    # skip downloading images and web fonts, and never autoplay media
+    firefox_options.set_preference("permissions.default.image", 2)
+    firefox_options.set_preference("gfx.downloadable_fonts.enabled", False)
+    firefox_options.set_preference("media.autoplay.default", 5)
+
+    if BLOCK_EXTERNAL_HOSTS:
+        # Send every non-local request to a closed port so it fails at once
+        firefox_options.set_preference("network.proxy.type", 1)
+        for scheme in ("http", "ssl"):
+            firefox_options.set_preference(f"network.proxy.{scheme}", "127.0.0.1")
+            firefox_options.set_preference(f"network.proxy.{scheme}_port", 1)
+        firefox_options.set_preference("network.proxy.no_proxies_on", "localhost, 127.0.0.1")
+
+    # Headless by default; set HEADLESS=false to show a browser window
+    headless = os.getenv("HEADLESS", "true").lower() != "false"
+
+    if headless:
         firefox_options.add_argument("--headless")
+        # Bake the window size into the launch instead of a post-start resize
+        firefox_options.add_argument("--width=1920")
+        firefox_options.add_argument("--height=1080")
 
     # Initialize driver
     driver = webdriver.Firefox(options=firefox_options)
-    driver.maximize_window()
+    if not headless:
+        driver.maximize_window()
+
+    # Fail fast instead of the 30s W3C default; helpers that need longer
+    # raise the script timeout themselves and restore it afterwards
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
 
     yield driver
 
@@ -50,6 +137,93 @@ def firefox_driver():
     driver.quit()
 
 
+@pytest.fixture(scope="session")
+def driver(request, primary_browser):
+    """
+    Provide a browser-agnostic WebDriver shared by the whole session.
+
+    Uses Chrome when it is the primary browser. Otherwise this is the same
+    Firefox instance as ``firefox_driver``, so suites that take either
+    fixture share one browser. State is cleared after each test by
+    ``_reset_session_drivers``.
+
+    Yields:
+        WebDriver: Chrome or Firefox driver instance
+
+    Example:
+        >>> def test_title(driver, base_url):
+        ...     driver.get(f"{base_url}/index.html")
+        ...     assert "Guia Turístico" in driver.title
+    """
+    if primary_browser == "firefox":
+        yield request.getfixturevalue("firefox_driver")
+        return
+    if primary_browser != "chrome":
+        pytest.skip("No WebDriver available (install Chrome or Firefox)")
+
+    chrome_options = ChromeOptions()
+    if os.getenv("HEADLESS", "true").lower() != "false":
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    # chromedriver talks DevTools to Chrome over pipes rather than a TCP port
+    chrome_options.add_argument("--remote-debugging-pipe")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    # Layout and computed styles do not need image pixels
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    if BLOCK_EXTERNAL_HOSTS:
+        chrome_options.add_argument(
+            "--host-resolver-rules=MAP * ~NOTFOUND, EXCLUDE localhost, EXCLUDE 127.0.0.1"
+        )
+
+    chrome_driver = webdriver.Chrome(options=chrome_options)
+    chrome_driver.set_script_timeout(SCRIPT_TIMEOUT)
+    chrome_driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+
+    yield chrome_driver
+
+    chrome_driver.quit()
+
+
+@pytest.fixture(autouse=True)
+def _reset_session_drivers(request):
+    """
+    Reset the shared session drivers after each test that uses them.
+
+    Clears cookies and web storage and returns to about:blank so tests
+    stay isolated without relaunching the browser. Tests that request
+    neither ``firefox_driver`` nor ``driver`` are left untouched (no
+    browser is started for them).
+    """
+    yield
+
+    names = [name for name in ("firefox_driver", "driver") if name in request.fixturenames]
+    if not names:
+        return
+
+    # index_page (or a keep_page test's own page) stays loaded for the next test
+    keep_page = (
+        "index_page" in request.fixturenames
+        or request.node.get_closest_marker("keep_page") is not None
+    )
+
+    # Both names can refer to the same Firefox
+    drivers = {id(d): d for d in (request.getfixturevalue(name) for name in names)}
+    for driver in drivers.values():
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # Storage is unavailable on some origins (e.g. about:blank)
+            pass
+        if not keep_page:
+            driver.get("about:blank")
+
+
 @pytest.fixture(scope="function")
 def console_capture(firefox_driver):
     """
@@ -75,6 +249,9 @@ def console_capture(firefox_driver):
         if any(summary.values()):
             print(f"\nConsole Log Summary: {summary}")
 
+    # Drop BiDi log handlers so they don't pile up on the shared driver
+    capture.close()
+
 
 @pytest.fixture(scope="function")
 def console_capture_autoclear(firefox_driver):
@@ -100,6 +277,7 @@ def console_capture_autoclear(firefox_driver):
     config = ConsoleConfig(auto_clear=True)
     capture = FirefoxConsoleCapture(firefox_driver, config=config)
     yield capture
+    capture.close()
 
 
 @pytest.fixture(scope="session")
@@ -107,6 +285,10 @@ def base_url():
     """
     Provide base URL for Guia Turístico application.
 
+    ``src/`` is served over HTTP on a free local port (see app_server.py),
+    so the browser can cache stylesheets and scripts between page loads.
+    Set ``GUIA_BASE_URL`` to test against another server instead.
+
     Returns:
         str: Base URL for local testing
 
@@ -114,7 +296,81 @@ def base_url():
         >>> def test_index_page(firefox_driver, base_url):
         ...     firefox_driver.get(f"{base_url}/index.html")
     """
-    return "file:///home/mpb/Documents/GitHub/guia_turistico/src"
+    return app_base_url()
+
+
+@pytest.fixture(scope="session")
+def primary_browser(pytestconfig):
+    """
+    Name of the WebDriver available to the suite.
+
+    Chrome is preferred, Firefox is the fallback. The probes run at most
+    once per session, and the answer is kept in the pytest cache for
+    PRIMARY_BROWSER_TTL seconds so later sessions skip probing.
+
+    Returns:
+        str | None: "chrome", "firefox", or None if neither is available
+
+    Example:
+        >>> def test_needs_browser(primary_browser):
+        ...     if primary_browser is None:
+        ...         pytest.skip("No WebDriver available")
+    """
+    cached = pytestconfig.cache.get("guia/primary_browser", None)
+    if cached and time.time() - cached.get("timestamp", 0) < PRIMARY_BROWSER_TTL:
+        return cached["name"]
+
+    import test_driver_summary as probe
+
+    # As in the script: a yes/no probe keeps Selenium Manager off the network
+    # unless SE_OFFLINE says otherwise, and only while it runs
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SE_OFFLINE", os.environ.get("SE_OFFLINE", "true"))
+        if probe.probe_chrome():
+            name = "chrome"
+        elif probe.probe_firefox():
+            name = "firefox"
+        else:
+            name = None
+
+    pytestconfig.cache.set(
+        "guia/primary_browser", {"name": name, "timestamp": time.time()}
+    )
+    return name
+
+
+@pytest.fixture(scope="class")
+def _index_page_url(firefox_driver, base_url):
+    """Load index.html once per test class; leave it when the class is done."""
+    url = f"{base_url}/index.html"
+    firefox_driver.get(url)
+    yield url
+    firefox_driver.get("about:blank")
+
+
+@pytest.fixture(scope="function")
+def index_page(request, firefox_driver, console_capture, _index_page_url):
+    """
+    Provide the Guia Turístico index page with clean state for each test.
+
+    The page is loaded once per class; between tests it is reset in place
+    (URL and captured logs) instead of
+    being reloaded. Mark a test ``@pytest.mark.fresh_page`` to navigate anew.
+
+    Returns:
+        str: URL of the loaded page
+
+    Example:
+        >>> def test_index(firefox_driver, console_capture, index_page):
+        ...     console_capture.assert_no_errors()
+    """
+    if request.node.get_closest_marker("fresh_page") or not firefox_driver.execute_script(
+        _RESET_PAGE_JS, _index_page_url
+    ):
+        firefox_driver.get(_index_page_url)
+    else:
+        console_capture.clear_logs()
+    return _index_page_url
 
 
 @pytest.fixture(scope="function")
@@ -9,17 +9,257 @@ Version: 1.0.0
 Python: 3.13+
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
 import re
+import threading
 import time
+import weakref
+from collections import deque
 from dataclasses import dataclass
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+# Raw level name -> normalized level (ERROR, WARNING, INFO, DEBUG)
+_LEVEL_MAP = {
+    "SEVERE": "ERROR",
+    "ERROR": "ERROR",
+    "WARNING": "WARNING",
+    "WARN": "WARNING",
+    "INFO": "INFO",
+    "LOG": "INFO",
+    "DEBUG": "DEBUG",
+}
+
+
+# Console listener installed into each page. Entries go into a fixed-size
+# ring buffer (window._captured_logs, __MAX_ENTRIES__ slots); re-running it
+# in a document that already has the listener only resizes the buffer if a
+# capture with another max_entries attached, keeping the newest entries.
+_LISTENER_JS_TEMPLATE = """
+if (window._captured_logs && window._captured_logs.length !== Math.max(1, __MAX_ENTRIES__)) {
+    const size = Math.max(1, __MAX_ENTRIES__);
+    const head = window._log_head;
+    const kept = window._console_capture_entries(head - size);
+    const logs = new Array(size).fill(null);
+    kept.forEach(function(entry, i) {
+        logs[(head - kept.length + i) % size] = entry;
+    });
+    window._captured_logs = logs;
+}
+if (!window._captured_logs) {
+    window._captured_logs = new Array(Math.max(1, __MAX_ENTRIES__)).fill(null);
+    window._log_head = 0;
+    window._log_read_head = 0;
+    window._captured_logs_epoch = Date.now() + Math.random();
+    window._console_listener_version = '1.0.0';
+
+    // Pending wait_for_log calls, resolved as soon as a match is recorded
+    window._log_waiters = [];
+
+    // Write into the ring buffer; oldest entries are overwritten in place.
+    // Entries are compact [timestamp, level, message, source, line, column,
+    // count] arrays, so no key names are repeated in what crosses the bridge.
+    // A repeat of the newest entry only bumps its count, as long as no
+    // retrieval has read that entry yet.
+    const record = function(entry) {
+        const logs = window._captured_logs;
+        const head = window._log_head;
+        const last = head > window._log_read_head ? logs[(head - 1) % logs.length] : null;
+        if (last && last[1] === entry[1] && last[2] === entry[2]) {
+            last[0] = entry[0];
+            last[6]++;
+            entry = last;
+        } else {
+            entry.push(1);
+            logs[head % logs.length] = entry;
+            window._log_head++;
+        }
+        if (window._log_waiters.length) {
+            window._log_waiters = window._log_waiters.filter(
+                waiter => !waiter(entry)
+            );
+        }
+    };
+
+    // Entries with absolute index >= since, oldest first. Slots left empty
+    // by growing the buffer are skipped.
+    window._console_capture_entries = function(since) {
+        const logs = window._captured_logs;
+        const head = window._log_head;
+        const entries = [];
+        for (let i = Math.max(since || 0, head - logs.length); i < head; i++) {
+            const entry = logs[i % logs.length];
+            if (entry) {
+                entries.push(entry);
+            }
+        }
+        return entries;
+    };
+
+    ['log', 'info', 'warn', 'error', 'debug'].forEach(function(method) {
+        const original = console[method];
+        console[method] = function(...args) {
+            try {
+                // Stack traces are costly: only capture the caller for warn/error
+                let sourceMatch = null;
+                if (method === 'error' || method === 'warn') {
+                    const stack = new Error().stack;
+                    const stackLines = stack ? stack.split('\\n') : [];
+                    const callerLine = stackLines[2] || '';
+
+                    sourceMatch = callerLine.match(/https?:\\/\\/[^\\s]+:(\\d+):(\\d+)/);
+                }
+
+                // Primitives are appended directly; only objects are
+                // serialized, truncated to 4KB
+                let message = '';
+                for (let i = 0; i < args.length; i++) {
+                    const arg = args[i];
+                    const type = typeof arg;
+                    if (i) {
+                        message += ' ';
+                    }
+                    if (type === 'string' || type === 'number' || type === 'boolean') {
+                        message += arg;
+                    } else {
+                        try {
+                            message += JSON.stringify(arg).slice(0, 4096);
+                        } catch (e) {
+                            message += String(arg);
+                        }
+                    }
+                }
+
+                record([
+                    Date.now(),
+                    method.toUpperCase(),
+                    message,
+                    sourceMatch ? sourceMatch[0].split(':').slice(0, -2).join(':') : 'unknown',
+                    sourceMatch ? parseInt(sourceMatch[1]) : null,
+                    sourceMatch ? parseInt(sourceMatch[2]) : null
+                ]);
+            } catch (e) {
+                // Silently fail to not break page functionality
+            }
+
+            // Call original console method
+            original.apply(console, args);
+        };
+    });
+
+    // Capture unhandled errors
+    window.addEventListener('error', function(event) {
+        record([
+            Date.now(),
+            'ERROR',
+            event.message || 'Unknown error',
+            event.filename || 'unknown',
+            event.lineno || null,
+            event.colno || null
+        ]);
+    });
+
+    // Capture unhandled promise rejections
+    window.addEventListener('unhandledrejection', function(event) {
+        record([
+            Date.now(),
+            'ERROR',
+            'Unhandled Promise Rejection: ' + (event.reason || 'Unknown'),
+            'promise',
+            null,
+            null
+        ]);
+    });
+}
+return window._console_listener_version;
+"""
+
+
+# Buffer size (max_entries) of the listener last registered as a BiDi preload
+# script on each driver
+_PRELOADED_DRIVERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Buffer size of the listener last injected into each driver by any capture
+_INJECTED_DRIVERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _expand(rows: list[list]) -> list[dict]:
+    """Rebuild log dicts from the listener's compact entry arrays."""
+    return [
+        {
+            "timestamp": t,
+            "level": lvl,
+            "message": msg,
+            "source": src,
+            "line_number": ln,
+            "column_number": col,
+            "count": n,
+        }
+        for t, lvl, msg, src, ln, col, n in rows
+    ]
+
+
+def _bidi_row(entry: object, level: str | None = None) -> list:
+    """Convert a BiDi log.entryAdded entry to the listener's compact format."""
+    stack = getattr(entry, "stack_trace", None) or getattr(entry, "stacktrace", None)
+    frames = stack.get("callFrames") if isinstance(stack, dict) else None
+    top = frames[0] if frames else {}
+    return [
+        int(getattr(entry, "timestamp", None) or time.time() * 1000),
+        level or str(getattr(entry, "level", None) or "info").upper(),
+        str(getattr(entry, "text", None) or ""),
+        top.get("url") or "unknown",
+        top.get("lineNumber"),
+        top.get("columnNumber"),
+        1,
+    ]
+
+
+@functools.cache
+def _driver_errors() -> tuple[type[Exception], ...]:
+    """
+    Selenium errors treated as "browser unavailable".
+
+    Imported on first use so loading this module (e.g. in every pytest
+    worker) does not pay for the selenium import up front.
+    """
+    from selenium.common.exceptions import (
+        JavascriptException,
+        NoSuchWindowException,
+        WebDriverException,
+    )
+
+    return (JavascriptException, NoSuchWindowException, WebDriverException)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a regex pattern, memoized across calls."""
+    return re.compile(pattern)
 
-from selenium import webdriver
-from selenium.common.exceptions import (
-    JavascriptException,
-    NoSuchWindowException,
-    WebDriverException,
-)
+
+# Python-only regex syntax that a JavaScript RegExp rejects or reads
+# differently: (?P...) groups, (?#...) comments, (?>...) atomic groups,
+# inline flags and the \A / \Z anchors. The second alternative consumes
+# other escapes, so an escaped backslash is never mistaken for one.
+_PY_ONLY_REGEX_RE = re.compile(r"(\\[AZ]|\(\?(?:P|#|>|[aiLmsux-]+[:)]))|\\.")
+
+# How often wait_for_log re-reads the page buffer when the pattern has to be
+# matched in Python, in seconds
+_PYTHON_WAIT_INTERVAL = 0.1
+
+
+@functools.lru_cache(maxsize=256)
+def _js_compatible(pattern: str) -> bool:
+    """Whether a JavaScript RegExp reads pattern the same way Python does."""
+    return not any(match.group(1) for match in _PY_ONLY_REGEX_RE.finditer(pattern))
 
 
 class ConsoleLogEntry(TypedDict):
@@ -31,9 +271,10 @@ class ConsoleLogEntry(TypedDict):
     source: str
     line_number: int | None
     column_number: int | None
+    count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConsoleConfig:
     """Configuration for console log capture."""
 
@@ -42,6 +283,14 @@ class ConsoleConfig:
     include_source: bool = True
     max_entries: int = 1000
     wait_timeout: float = 10.0
+    # Receive logs as WebDriver BiDi events instead of polling the page.
+    # Events travel on their own WebSocket, so a log may arrive just after
+    # the script that emitted it returns; wait for it rather than reading once.
+    bidi_events: bool = False
+    # Opt-in: reuse a get_logs result for this many seconds. A cached result
+    # misses anything the page logs in the meantime, so never enable it for
+    # captures that are polled while waiting for output.
+    cache_ttl: float = 0
 
 
 class FirefoxConsoleCapture:
@@ -71,25 +320,135 @@ class FirefoxConsoleCapture:
             config: Optional configuration settings
 
         Raises:
-            TypeError: If driver is not a Firefox WebDriver instance
+            TypeError: If driver is not a Firefox WebDriver session
             WebDriverException: If driver session is invalid
         """
-        if not isinstance(driver, webdriver.Firefox):
+        # Duck-typed so remote/grid Firefox sessions are accepted too
+        capabilities = getattr(driver, "capabilities", None)
+        if (
+            not hasattr(driver, "execute_script")
+            or not isinstance(capabilities, dict)
+            or capabilities.get("browserName", "firefox") != "firefox"
+        ):
             raise TypeError(
                 f"Expected webdriver.Firefox instance, got {type(driver).__name__}"
             )
 
         self.driver = driver
         self.config = config or ConsoleConfig()
+        # Hot-path settings, read once instead of through config on every call
+        self._max_entries = self.config.max_entries
+        self._auto_clear = self.config.auto_clear
+        self._cache_ttl = self.config.cache_ttl
+        self._listener_js = _LISTENER_JS_TEMPLATE.replace(
+            "__MAX_ENTRIES__", str(int(self._max_entries))
+        )
         self._listener_injected = False
+        self._preloaded = False
+        # Incremental retrieval, per normalized level filter (None = all levels):
+        # entries already fetched from the browser buffer, the absolute buffer
+        # index to resume from, and the buffer's epoch (changes when the
+        # browser-side buffer is reset, e.g. cleared or page navigated)
+        self._accumulated: dict[str | None, list[dict]] = {}
+        self._cursors: dict[str | None, int] = {}
+        self._epoch = None
+        # (fetched_at, level, logs) from the last get_logs call
+        self._cache: tuple[float, str | None, list[ConsoleLogEntry]] | None = None
+        # BiDi event mode: compact rows pushed by the driver's event thread,
+        # guarded by a condition that wakes wait_for_log on each new entry
+        self._events: deque | None = None
+        self._events_cond = threading.Condition()
+        self._events_since = 0
+        self._handler_ids: list[tuple[str, int]] = []
+        if self.config.bidi_events and capabilities.get("webSocketUrl"):
+            self._subscribe_bidi()
+
+    def _subscribe_bidi(self) -> None:
+        """
+        Register WebDriver BiDi log handlers feeding a local buffer.
+
+        On success get_logs, has_errors and wait_for_log are answered
+        in-process; on failure the capture keeps polling the page listener.
+        """
+        self._events = deque(maxlen=self._max_entries)
+        try:
+            script = self.driver.script
+            handler_id = script.add_console_message_handler(self._on_console_event)
+            self._handler_ids.append(("console_message", handler_id))
+            handler_id = script.add_javascript_error_handler(self._on_error_event)
+            self._handler_ids.append(("javascript_error", handler_id))
+        except (AttributeError, TypeError, *_driver_errors()):
+            # Selenium without BiDi log support, or BiDi not enabled
+            self.close()
+
+    def _on_console_event(self, entry: object) -> None:
+        self._record_event(_bidi_row(entry))
+
+    def _on_error_event(self, entry: object) -> None:
+        self._record_event(_bidi_row(entry, "ERROR"))
+
+    def _record_event(self, row: list) -> None:
+        with self._events_cond:
+            if self._events is None or row[0] < self._events_since:
+                return  # Closed, or logged before the last clear_logs
+            self._events.append(row)
+            self._events_cond.notify_all()
+
+    def close(self) -> None:
+        """
+        Unregister BiDi log handlers, if any.
+
+        The capture falls back to polling the page listener afterwards.
+        """
+        handler_ids, self._handler_ids = self._handler_ids, []
+        for kind, handler_id in handler_ids:
+            try:
+                getattr(self.driver.script, f"remove_{kind}_handler")(handler_id)
+            except (AttributeError, KeyError, ValueError, *_driver_errors()):
+                pass
+        with self._events_cond:
+            self._events = None
+            self._events_cond.notify_all()
+
+    def _add_preload_script(self) -> bool:
+        """
+        Register the listener as a WebDriver BiDi preload script.
+
+        Preload scripts run at document start on every navigation, so logs
+        from early page init are captured and the buffer survives page
+        loads without re-injection. Registered once per driver and buffer
+        size: a capture with another max_entries registers its listener too,
+        and since it runs after the earlier one it resizes the buffer.
+
+        Returns:
+            True if the driver runs the listener on every new document
+        """
+        if _PRELOADED_DRIVERS.get(self.driver) == self._max_entries:
+            return True
+
+        declaration = "function() {" + self._listener_js + "}"
+        try:
+            self.driver.script.add_preload_script(declaration)
+        except (AttributeError, TypeError, *_driver_errors()):
+            # Selenium without BiDi support, or BiDi not enabled for the session
+            return False
+
+        _PRELOADED_DRIVERS[self.driver] = self._max_entries
+        return True
 
     def _inject_console_listener(self) -> None:
         """
         Inject JavaScript to capture console logs.
 
         This method overrides native console methods to capture logs in
-        window._captured_logs array. It preserves original console behavior
-        while capturing logs for later retrieval.
+        window._captured_logs, a fixed-size ring buffer of
+        ``config.max_entries`` slots (window._log_head counts every entry ever
+        written). It preserves original console behavior while capturing logs
+        for later retrieval via window._console_capture_entries(since).
+
+        Where the driver supports WebDriver BiDi the listener is also
+        registered as a preload script for subsequent navigations; the
+        current document is always injected directly.
 
         Raises:
             JavascriptException: If injection fails
@@ -98,104 +457,159 @@ class FirefoxConsoleCapture:
         if self._listener_injected:
             return
 
-        script = """
-        if (!window._captured_logs) {
-            window._captured_logs = [];
-            window._console_listener_version = '1.0.0';
-            
-            ['log', 'info', 'warn', 'error', 'debug'].forEach(function(method) {
-                const original = console[method];
-                console[method] = function(...args) {
-                    try {
-                        const stack = new Error().stack;
-                        const stackLines = stack ? stack.split('\\n') : [];
-                        const callerLine = stackLines[2] || '';
-                        
-                        const sourceMatch = callerLine.match(/https?:\\/\\/[^\\s]+:(\\d+):(\\d+)/);
-                        
-                        window._captured_logs.push({
-                            timestamp: Date.now(),
-                            level: method.toUpperCase(),
-                            message: args.map(arg => {
-                                try {
-                                    if (typeof arg === 'object') {
-                                        return JSON.stringify(arg);
-                                    }
-                                    return String(arg);
-                                } catch (e) {
-                                    return String(arg);
-                                }
-                            }).join(' '),
-                            source: sourceMatch ? sourceMatch[0].split(':').slice(0, -2).join(':') : 'unknown',
-                            line_number: sourceMatch ? parseInt(sourceMatch[1]) : null,
-                            column_number: sourceMatch ? parseInt(sourceMatch[2]) : null
-                        });
-                        
-                        // Limit stored logs to prevent memory issues
-                        if (window._captured_logs.length > 10000) {
-                            window._captured_logs = window._captured_logs.slice(-5000);
-                        }
-                    } catch (e) {
-                        // Silently fail to not break page functionality
-                    }
-                    
-                    // Call original console method
-                    original.apply(console, args);
-                };
-            });
-            
-            // Capture unhandled errors
-            window.addEventListener('error', function(event) {
-                window._captured_logs.push({
-                    timestamp: Date.now(),
-                    level: 'ERROR',
-                    message: event.message || 'Unknown error',
-                    source: event.filename || 'unknown',
-                    line_number: event.lineno || null,
-                    column_number: event.colno || null
-                });
-            });
-            
-            // Capture unhandled promise rejections
-            window.addEventListener('unhandledrejection', function(event) {
-                window._captured_logs.push({
-                    timestamp: Date.now(),
-                    level: 'ERROR',
-                    message: 'Unhandled Promise Rejection: ' + (event.reason || 'Unknown'),
-                    source: 'promise',
-                    line_number: null,
-                    column_number: null
-                });
-            });
-        }
-        return window._console_listener_version;
-        """
+        self._preloaded = self._add_preload_script()
 
-        try:
-            version = self.driver.execute_script(script)
+        # Another capture on this driver may already have installed the
+        # listener in the current document; probe before sending the script.
+        # A listener with another buffer size is re-run to resize it.
+        if _INJECTED_DRIVERS.get(self.driver) == self._max_entries and self._listener_present():
             self._listener_injected = True
-            return version
-        except (JavascriptException, NoSuchWindowException, WebDriverException) as e:
+            return None
+
+        return self._install_listener()
+
+    def _install_listener(self) -> str:
+        """Run the listener script in the current document."""
+        try:
+            version = self.driver.execute_script(self._listener_js)
+        except _driver_errors() as e:
+            from selenium.common.exceptions import WebDriverException
+
             raise WebDriverException(f"Failed to inject console listener: {e}") from e
 
-    def _retrieve_captured_logs(self) -> list[dict]:
+        self._listener_injected = True
+        _INJECTED_DRIVERS[self.driver] = self._max_entries
+        return version
+
+    def _listener_present(self) -> bool:
+        """Check whether the current document already has the listener."""
+        try:
+            return bool(
+                self.driver.execute_script(
+                    "return window._console_listener_version || null;"
+                )
+            )
+        except _driver_errors():
+            return False
+
+    def reinject_if_needed(self) -> bool:
         """
-        Retrieve logs captured by injected JavaScript listener.
+        Install the listener only if the current document lacks it.
+
+        Cheap to call after a navigation: a single small probe when the
+        listener is already present (e.g. via the BiDi preload script).
 
         Returns:
-            List of log entries as dictionaries
+            True if the listener had to be injected
+        """
+        if self._listener_present():
+            self._listener_injected = True
+            return False
+
+        self._install_listener()
+        return True
+
+    def _retrieve_captured_logs(self, level: str | None = None) -> list[dict]:
+        """
+        Retrieve new logs captured by injected JavaScript listener.
+
+        Only entries past this level's cursor (an absolute ring-buffer index),
+        and only those matching the (normalized) level, cross the WebDriver
+        bridge. If the browser-side buffer was reset since the last call
+        (cleared or lost on navigation), all accumulated state and cursors
+        are reset and the whole current buffer is scanned.
+
+        Args:
+            level: Optional normalized level filter (ERROR, WARNING, INFO, DEBUG)
+
+        Returns:
+            List of new log entries as dictionaries
 
         Raises:
             WebDriverException: If retrieval fails
         """
+        script = """
+        const epoch = window._captured_logs_epoch || null;
+        const level = arguments[2];
+        const aliases = {SEVERE: 'ERROR', WARN: 'WARNING', LOG: 'INFO'};
+        const since = epoch === arguments[1] ? arguments[0] : 0;
+        let fresh = window._console_capture_entries ? window._console_capture_entries(since) : [];
+        if (level) {
+            fresh = fresh.filter(l => (aliases[l[1]] || l[1]) === level);
+        }
+        // Entries handed out are final: later repeats start a new entry
+        window._log_read_head = window._log_head || 0;
+        return [epoch, window._log_head || 0, fresh];
+        """
+
         try:
-            logs = self.driver.execute_script("return window._captured_logs || [];")
-            return logs if isinstance(logs, list) else []
-        except (JavascriptException, NoSuchWindowException, WebDriverException) as e:
+            epoch, length, logs = self.driver.execute_script(
+                script, self._cursors.get(level, 0), self._epoch, level
+            )
+            logs = _expand(logs)
+        except (*_driver_errors(), TypeError, ValueError):
             # Return empty list instead of crashing
             return []
 
-    def _parse_log_level(self, level_str: str) -> str:
+        if epoch is None and not self._preloaded:
+            # Navigated away and nothing re-installs the listener: inject again
+            self._listener_injected = False
+
+        if epoch != self._epoch:
+            self._epoch = epoch
+            self._accumulated.clear()
+            self._cursors.clear()
+
+        self._cursors[level] = length
+        return logs
+
+    def _retrieve_and_clear(self, level: str | None = None) -> list[dict]:
+        """
+        Retrieve all captured logs and clear the buffer in one round-trip.
+
+        Used by the auto_clear path in place of a retrieval followed by a
+        separate clear_logs() call.
+
+        Args:
+            level: Optional normalized level filter (ERROR, WARNING, INFO, DEBUG)
+
+        Returns:
+            List of log entries as dictionaries
+        """
+        script = """
+        if (!window._console_capture_entries) {
+            return null;
+        }
+        const level = arguments[0];
+        const aliases = {SEVERE: 'ERROR', WARN: 'WARNING', LOG: 'INFO'};
+        let logs = window._console_capture_entries(0);
+        if (level) {
+            logs = logs.filter(l => (aliases[l[1]] || l[1]) === level);
+        }
+        window._captured_logs.fill(null);
+        window._log_head = 0;
+        window._log_read_head = 0;
+        window._captured_logs_epoch = Date.now() + Math.random();
+        return logs;
+        """
+
+        self._accumulated.clear()
+        self._cursors.clear()
+        self._cache = None
+
+        try:
+            logs = self.driver.execute_script(script, level)
+            if logs is None:
+                if not self._preloaded:
+                    # Navigated away and nothing re-installs the listener
+                    self._listener_injected = False
+                return []
+            return _expand(logs)
+        except (*_driver_errors(), TypeError, ValueError):
+            return []
+
+    @staticmethod
+    def _parse_log_level(level_str: str) -> str:
         """
         Parse and normalize log level string.
 
@@ -208,17 +622,11 @@ class FirefoxConsoleCapture:
         Raises:
             ValueError: If log level is unknown
         """
-        match level_str.upper():
-            case "SEVERE" | "ERROR":
-                return "ERROR"
-            case "WARNING" | "WARN":
-                return "WARNING"
-            case "INFO" | "LOG":
-                return "INFO"
-            case "DEBUG":
-                return "DEBUG"
-            case _:
-                raise ValueError(f"Unknown log level: {level_str}")
+        # Fast path: the injected listener already stores uppercase levels
+        normalized = _LEVEL_MAP.get(level_str) or _LEVEL_MAP.get(level_str.upper())
+        if normalized is None:
+            raise ValueError(f"Unknown log level: {level_str}")
+        return normalized
 
     def _filter_logs(
         self, logs: list[dict], level: str | None = None
@@ -233,31 +641,50 @@ class FirefoxConsoleCapture:
         Returns:
             Filtered list of ConsoleLogEntry objects
         """
-        filtered = []
+        try:
+            target = self._parse_log_level(level) if level else None
+        except ValueError:
+            # Unknown filter level matches nothing
+            return []
 
-        for log in logs:
-            try:
-                log_level = self._parse_log_level(log.get("level", "INFO"))
-
-                # Apply level filter if specified
-                if level and log_level != self._parse_log_level(level):
-                    continue
-
-                entry: ConsoleLogEntry = {
-                    "timestamp": log.get("timestamp", 0),
-                    "level": log_level,
-                    "message": log.get("message", ""),
-                    "source": log.get("source", "unknown"),
-                    "line_number": log.get("line_number"),
-                    "column_number": log.get("column_number"),
-                }
-                filtered.append(entry)
+        # Stop converting as soon as max_entries entries have been kept
+        entries = (self._to_entry(log, target) for log in logs)
+        return list(
+            itertools.islice(
+                (entry for entry in entries if entry is not None), self._max_entries
+            )
+        )
+
+    def _to_entry(self, log: dict, target: str | None) -> ConsoleLogEntry | None:
+        """
+        Convert one raw log to a ConsoleLogEntry.
 
-            except (ValueError, KeyError):
-                # Skip malformed log entries
-                continue
+        Args:
+            log: Raw log entry from browser
+            target: Normalized level filter, or None for all levels
 
-        return filtered[: self.config.max_entries]
+        Returns:
+            The entry, or None if it is filtered out or malformed
+        """
+        try:
+            log_level = self._parse_log_level(log.get("level", "INFO"))
+        except (ValueError, KeyError):
+            # Skip malformed log entries
+            return None
+
+        # Apply level filter if specified
+        if target and log_level != target:
+            return None
+
+        return {
+            "timestamp": log.get("timestamp", 0),
+            "level": log_level,
+            "message": log.get("message", ""),
+            "source": log.get("source", "unknown"),
+            "line_number": log.get("line_number"),
+            "column_number": log.get("column_number"),
+            "count": log.get("count", 1),
+        }
 
     def get_logs(self, level: str | None = None) -> list[ConsoleLogEntry]:
         """
@@ -276,14 +703,42 @@ class FirefoxConsoleCapture:
             >>> logs = console.get_logs()
             >>> error_logs = console.get_logs(level="ERROR")
         """
+        try:
+            target = self._parse_log_level(level) if level else None
+        except ValueError:
+            # Unknown filter level matches nothing
+            return []
+
+        if self._events is not None:
+            with self._events_cond:
+                rows = list(self._events)
+                if self._auto_clear:
+                    self._events.clear()
+            return self._filter_logs(_expand(rows), target)
+
+        # With cache_ttl set, back-to-back calls reuse the last result
+        cache = self._cache
+        if (
+            cache
+            and cache[1] == target
+            and time.monotonic() - cache[0] < self._cache_ttl
+        ):
+            return list(cache[2])
+
         self._inject_console_listener()
-        raw_logs = self._retrieve_captured_logs()
-        filtered_logs = self._filter_logs(raw_logs, level)
 
-        if self.config.auto_clear:
-            self.clear_logs()
+        if self._auto_clear:
+            return self._filter_logs(self._retrieve_and_clear(target), target)
 
-        return filtered_logs
+        new_logs = self._retrieve_captured_logs(target)
+        accumulated = self._accumulated.setdefault(target, [])
+        accumulated.extend(new_logs)
+        # Mirror the browser ring buffer: keep only the newest max_entries
+        del accumulated[:-self._max_entries]
+        filtered_logs = self._filter_logs(accumulated, target)
+        self._cache = (time.monotonic(), target, filtered_logs)
+
+        return list(filtered_logs)
 
     def get_errors(self) -> list[ConsoleLogEntry]:
         """
@@ -321,12 +776,29 @@ class FirefoxConsoleCapture:
         """
         # Ensure listener is injected before clearing
         self._inject_console_listener()
-        
+
+        self._accumulated.clear()
+        self._cursors.clear()
+        self._cache = None
+
         try:
-            self.driver.execute_script("window._captured_logs = [];")
-        except (JavascriptException, NoSuchWindowException, WebDriverException):
+            cleared_at = self.driver.execute_script(
+                "window._captured_logs.fill(null);"
+                "window._log_head = 0;"
+                "window._log_read_head = 0;"
+                "window._captured_logs_epoch = Date.now() + Math.random();"
+                "return Date.now();"
+            )
+        except _driver_errors():
             # Silently fail - logs will be overwritten anyway
-            pass
+            cleared_at = None
+
+        with self._events_cond:
+            if self._events is not None:
+                self._events.clear()
+                # Drop events still in flight from before the clear
+                if isinstance(cleared_at, (int, float)):
+                    self._events_since = cleared_at
 
     def wait_for_log(
         self,
@@ -337,6 +809,13 @@ class FirefoxConsoleCapture:
         """
         Wait for a console log matching the specified pattern.
 
+        The pattern is matched browser-side (as a JavaScript RegExp) and the
+        listener wakes the waiter as soon as a matching entry is recorded, so
+        only that entry crosses the WebDriver bridge and nothing polls.
+        Patterns using Python-only syntax ((?P<name>...), inline flags,
+        \\A, \\Z, ...) are matched with Python ``re`` instead, re-reading
+        the page buffer, so they mean the same as in get_logs.
+
         Args:
             message_pattern: Regex pattern to match log message
             timeout: Maximum wait time in seconds (default: config.wait_timeout)
@@ -345,27 +824,203 @@ class FirefoxConsoleCapture:
         Returns:
             Matching ConsoleLogEntry or None if timeout
 
+        Raises:
+            re.error: If message_pattern is not a valid regex
+
         Example:
             >>> log = console.wait_for_log(r"API call completed", timeout=5.0)
             >>> assert log is not None, "Expected log not found"
         """
+        # Validate up front (cached) so bad patterns fail loudly, not as a timeout
+        _compile(message_pattern)
+
         timeout = timeout or self.config.wait_timeout
-        pattern = re.compile(message_pattern)
-        start_time = time.time()
+        target_level = self._parse_log_level(level) if level else None
 
-        self._inject_console_listener()
+        return self._waiter(message_pattern)(message_pattern, target_level, timeout)
 
-        while time.time() - start_time < timeout:
-            logs = self.get_logs(level=level)
+    async def wait_for_log_async(
+        self,
+        message_pattern: str,
+        timeout: float | None = None,
+        level: str | None = None,
+    ) -> ConsoleLogEntry | None:
+        """
+        Async variant of wait_for_log for tests driven by an event loop.
 
-            for log in logs:
-                if pattern.search(log["message"]):
-                    return log
+        The blocking WebDriver call runs in a worker thread, so other
+        coroutines keep running while the browser waits for a match.
 
-            time.sleep(0.1)  # Poll every 100ms
+        Args:
+            message_pattern: Regex pattern to match log message
+            timeout: Maximum wait time in seconds (default: config.wait_timeout)
+            level: Optional log level filter
+
+        Returns:
+            Matching ConsoleLogEntry or None if timeout
+
+        Raises:
+            re.error: If message_pattern is not a valid regex
+
+        Example:
+            >>> log = await console.wait_for_log_async(r"Map ready", timeout=5.0)
+            >>> assert log is not None, "Expected log not found"
+        """
+        _compile(message_pattern)
 
+        timeout = timeout or self.config.wait_timeout
+        target_level = self._parse_log_level(level) if level else None
+
+        try:
+            # The browser gives up after `timeout`; this only guards a hung bridge
+            async with asyncio.timeout(timeout + 1):
+                return await asyncio.to_thread(
+                    self._waiter(message_pattern), message_pattern, target_level, timeout
+                )
+        except TimeoutError:
+            return None
+
+    def _waiter(self, message_pattern: str):
+        """
+        Pick the wait strategy: local BiDi events, the page listener, or
+        Python-side matching for patterns JavaScript cannot express.
+        """
+        if self._events is not None:
+            return self._wait_for_event
+        if _js_compatible(message_pattern):
+            return self._wait_in_browser
+        return self._wait_in_python
+
+    def _wait_for_event(
+        self, message_pattern: str, target_level: str | None, timeout: float
+    ) -> ConsoleLogEntry | None:
+        """Block until a matching BiDi log event arrives, without polling."""
+        regex = _compile(message_pattern)
+        deadline = time.monotonic() + timeout
+
+        with self._events_cond:
+            while self._events is not None:
+                for entry in self._filter_logs(_expand(self._events), target_level):
+                    if regex.search(entry["message"]):
+                        return entry
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._events_cond.wait(remaining)
+
+        # Closed while waiting
         return None
 
+    def _wait_in_browser(
+        self, message_pattern: str, target_level: str | None, timeout: float
+    ) -> ConsoleLogEntry | None:
+        """
+        Block in a single async script until a matching log is recorded.
+
+        Entries already in the buffer are checked first; after that the
+        listener notifies a registered waiter on each new entry, so there is
+        no polling on either side of the bridge.
+        """
+        self._inject_console_listener()
+
+        script = """
+        const callback = arguments[arguments.length - 1];
+        let pattern;
+        try {
+            pattern = new RegExp(arguments[0]);
+        } catch (e) {
+            // Valid in Python but not in JavaScript: match it in Python
+            return callback({invalid: String(e)});
+        }
+        const level = arguments[1];
+        const aliases = {SEVERE: 'ERROR', WARN: 'WARNING', LOG: 'INFO'};
+        const matches = log => Boolean(log) &&
+            (!level || (aliases[log[1]] || log[1]) === level) &&
+            pattern.test(log[2]);
+
+        const existing = window._console_capture_entries(0).find(matches);
+        if (existing) {
+            return callback(existing);
+        }
+
+        let done = false;
+        const waiter = function(log) {
+            if (done || !matches(log)) {
+                return done;
+            }
+            done = true;
+            callback(log);
+            return true;
+        };
+        window._log_waiters.push(waiter);
+        setTimeout(function() {
+            if (!done) {
+                done = true;
+                window._log_waiters = window._log_waiters.filter(w => w !== waiter);
+                callback(null);
+            }
+        }, arguments[2] * 1000);
+        """
+
+        from selenium.common.exceptions import JavascriptException
+
+        started = time.monotonic()
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 1)
+        try:
+            log = self.driver.execute_async_script(
+                script, message_pattern, target_level, timeout
+            )
+        except JavascriptException:
+            # A broken wait script is a bug, not "no match"
+            raise
+        except _driver_errors():
+            log = None
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if isinstance(log, dict) and "invalid" in log:
+            remaining = max(0.0, timeout - (time.monotonic() - started))
+            return self._wait_in_python(message_pattern, target_level, remaining)
+        if not isinstance(log, list):
+            return None
+
+        try:
+            entries = self._filter_logs(_expand([log]))
+        except (TypeError, ValueError):
+            return None
+        return entries[0] if entries else None
+
+    def _wait_in_python(
+        self, message_pattern: str, target_level: str | None, timeout: float
+    ) -> ConsoleLogEntry | None:
+        """
+        Re-read the page buffer until a Python ``re`` match is recorded.
+
+        Used for patterns a JavaScript RegExp cannot express, so wait_for_log
+        accepts the same syntax as get_logs. Reading does not move the
+        get_logs cursors.
+        """
+        regex = _compile(message_pattern)
+        deadline = time.monotonic() + timeout
+        self._inject_console_listener()
+
+        while True:
+            try:
+                rows = self.driver.execute_script(
+                    "return window._console_capture_entries"
+                    " ? window._console_capture_entries(0) : [];"
+                )
+            except _driver_errors():
+                return None
+            for entry in self._filter_logs(_expand(rows or []), target_level):
+                if regex.search(entry["message"]):
+                    return entry
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(_PYTHON_WAIT_INTERVAL, remaining))
+
     def has_errors(self) -> bool:
         """
         Check if any console errors exist.
@@ -376,7 +1031,22 @@ class FirefoxConsoleCapture:
         Example:
             >>> assert not console.has_errors(), "Console errors detected"
         """
-        return len(self.get_errors()) > 0
+        if self._events is not None:
+            with self._events_cond:
+                return any(_LEVEL_MAP.get(row[1]) == "ERROR" for row in self._events)
+
+        # Reduce browser-side so only a boolean crosses the WebDriver bridge
+        self._inject_console_listener()
+
+        try:
+            return bool(
+                self.driver.execute_script(
+                    "return (window._captured_logs || []).some("
+                    "l => l && (l[1] === 'ERROR' || l[1] === 'SEVERE'));"
+                )
+            )
+        except _driver_errors():
+            return False
 
     def assert_no_errors(self, message: str = "Console errors detected") -> None:
         """
@@ -391,6 +1061,12 @@ class FirefoxConsoleCapture:
         Example:
             >>> console.assert_no_errors("Page should load without errors")
         """
+        # Success is the common case: settle it with one boolean round-trip
+        # and only fetch/format the entries once we know there are errors
+        # (errors already fetched may have since left the browser buffer)
+        if not self._accumulated.get("ERROR") and not self.has_errors():
+            return
+
         errors = self.get_errors()
         if errors:
             error_messages = "\n".join(
@@ -409,12 +1085,38 @@ class FirefoxConsoleCapture:
             >>> summary = console.get_log_summary()
             >>> print(f"Errors: {summary['ERROR']}, Warnings: {summary['WARNING']}")
         """
-        logs = self.get_logs()
-        summary = {"ERROR": 0, "WARNING": 0, "INFO": 0, "DEBUG": 0}
+        if self._events is not None:
+            summary = {"ERROR": 0, "WARNING": 0, "INFO": 0, "DEBUG": 0}
+            with self._events_cond:
+                for row in self._events:
+                    level = _LEVEL_MAP.get(row[1])
+                    if level in summary:
+                        summary[level] += row[6]
+            return summary
+
+        # Count browser-side so message payloads never cross the WebDriver bridge
+        self._inject_console_listener()
 
-        for log in logs:
-            level = log["level"]
-            if level in summary:
-                summary[level] += 1
+        script = """
+        const summary = {ERROR: 0, WARNING: 0, INFO: 0, DEBUG: 0};
+        const aliases = {SEVERE: 'ERROR', WARN: 'WARNING', LOG: 'INFO'};
+        for (const log of (window._captured_logs || [])) {
+            if (!log) {
+                continue;  // Unused ring-buffer slot
+            }
+            const level = aliases[log[1]] || log[1];
+            if (level in summary) {
+                summary[level] += log[6] || 1;
+            }
+        }
+        return summary;
+        """
 
-        return summary
+        try:
+            summary = self.driver.execute_script(script)
+        except _driver_errors():
+            summary = None
+
+        return summary if isinstance(summary, dict) else {
+            "ERROR": 0, "WARNING": 0, "INFO": 0, "DEBUG": 0
+        }
@@ -12,14 +12,99 @@ Usage:
     setup_mock_geolocation(driver, latitude=-18.4696091, longitude=-43.4953982)
 """
 
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.common.exceptions import TimeoutException
+import time
+import weakref
+
+from selenium.common.exceptions import TimeoutException
 
 # Module-level constants for default test parameters
 DEFAULT_TIMEOUT = 10   # Maximum wait time in seconds for library load
 DEFAULT_ACCURACY = 10  # Position accuracy in meters
 DEFAULT_DELAY = 100    # Simulated async geolocation delay in milliseconds
 
+# Optional GeolocationCoordinates fields and their defaults
+_OPTIONAL_COORDS = {
+    'altitude': None,
+    'altitudeAccuracy': None,
+    'heading': None,
+    'speed': None,
+}
+
+# Drivers whose current page already has guia.js loaded. Loaded state does
+# not regress within a page; a stale entry after navigation is caught by
+# setup_mock_geolocation, which re-checks and retries once.
+_READY_DRIVERS = weakref.WeakSet()
+
+# Installs MockGeolocationProvider behind GeolocationService. The script text
+# never changes; coordinates, accuracy and delay are passed as arguments[0..3].
+_SETUP_JS = """
+const [latitude, longitude, accuracy, delay] = arguments;
+
+try {
+    // Create mock position object
+    window.TEST_POSITION = {
+        coords: {
+            latitude: latitude,
+            longitude: longitude,
+            accuracy: accuracy,
+            altitude: null,
+            altitudeAccuracy: null,
+            heading: null,
+            speed: null
+        },
+        timestamp: Date.now()
+    };
+
+    // Create MockGeolocationProvider instance
+    window.TEST_MOCK_PROVIDER = new window.MockGeolocationProvider({
+        defaultPosition: window.TEST_POSITION,
+        supported: true,
+        delay: delay
+    });
+
+    // Override GeolocationService once per page with a subclass that reads
+    // the current TEST_MOCK_PROVIDER; later calls only replace the provider,
+    // so the constructor's prototype chain is never mutated after creation
+    if (!window._OriginalGeolocationService) {
+        window._OriginalGeolocationService = window.GeolocationService;
+
+        window.GeolocationService = class extends window._OriginalGeolocationService {
+            constructor(locationResult, provider, pm, config) {
+                // Always use test mock provider instead of browser geolocation
+                console.log('[TEST] GeolocationService created with MockGeolocationProvider');
+                super(
+                    locationResult,
+                    window.TEST_MOCK_PROVIDER,  // Force mock provider
+                    pm,
+                    config
+                );
+            }
+        };
+    }
+
+    console.log('[TEST] MockGeolocationProvider configured successfully');
+    console.log('[TEST] Test coordinates:', latitude, longitude);
+
+    return {
+        success: true,
+        coordinates: {
+            latitude: latitude,
+            longitude: longitude,
+            accuracy: accuracy
+        },
+        providerType: 'MockGeolocationProvider'
+    };
+
+} catch (error) {
+    console.error('[TEST] Failed to configure mock:', error);
+    return {
+        success: false,
+        error: error.message,
+        stack: error.stack
+    };
+}
+"""
+
 
 def wait_for_guia_library(driver, timeout=DEFAULT_TIMEOUT):
     """
@@ -32,28 +117,50 @@ def wait_for_guia_library(driver, timeout=DEFAULT_TIMEOUT):
     Returns:
         bool: True if library loaded successfully
         
-    Raises:
-        TimeoutException: If library doesn't load within timeout
     """
-    wait = WebDriverWait(driver, timeout)
+    if driver in _READY_DRIVERS:
+        return True
 
-    # Check that all three guia.js globals are present before proceeding
+    # Check browser-side every 50ms that all three guia.js globals are
+    # present, in one async call instead of a WebDriver round-trip per poll
+    previous_timeout = driver.timeouts.script
+    driver.set_script_timeout(timeout + 1)
     try:
-        is_loaded = wait.until(
-            lambda d: d.execute_script("""
-                return typeof window.MockGeolocationProvider !== 'undefined' &&
-                       typeof window.GeolocationService !== 'undefined' &&
-                       typeof window.WebGeocodingManager !== 'undefined';
-            """)
-        )
+        is_loaded = driver.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            const ready = () =>
+                typeof window.MockGeolocationProvider !== 'undefined' &&
+                typeof window.GeolocationService !== 'undefined' &&
+                typeof window.WebGeocodingManager !== 'undefined';
+            if (ready()) {
+                return done(true);
+            }
+            const poll = setInterval(() => {
+                if (ready()) {
+                    clearInterval(poll);
+                    clearTimeout(giveUp);
+                    done(true);
+                }
+            }, 50);
+            const giveUp = setTimeout(() => {
+                clearInterval(poll);
+                done(false);
+            }, arguments[0] * 1000);
+        """, timeout)
     except TimeoutException:
+        is_loaded = False
+    finally:
+        driver.set_script_timeout(previous_timeout)
+
+    if not is_loaded:
         import logging
         logging.warning(
             "[wait_for_guia_library] guia.js library did not load within %ds", timeout
         )
         return False
 
-    return is_loaded
+    _READY_DRIVERS.add(driver)
+    return True
 
 
 def setup_mock_geolocation(driver, latitude, longitude, accuracy=DEFAULT_ACCURACY, delay=DEFAULT_DELAY):
@@ -83,81 +190,19 @@ def setup_mock_geolocation(driver, latitude, longitude, accuracy=DEFAULT_ACCURAC
             print(f"Mock configured: {result['coordinates']}")
     """
     # Wait for library to load
+    cached = driver in _READY_DRIVERS
     if not wait_for_guia_library(driver):
         return {
             'success': False,
             'error': 'guia.js library not loaded'
         }
     
-    # Execute mock setup script
-    mock_setup_script = f"""
-    try {{
-        // Create mock position object
-        window.TEST_POSITION = {{
-            coords: {{
-                latitude: {latitude},
-                longitude: {longitude},
-                accuracy: {accuracy},
-                altitude: null,
-                altitudeAccuracy: null,
-                heading: null,
-                speed: null
-            }},
-            timestamp: Date.now()
-        }};
-        
-        // Create MockGeolocationProvider instance
-        window.TEST_MOCK_PROVIDER = new window.MockGeolocationProvider({{
-            defaultPosition: window.TEST_POSITION,
-            supported: true,
-            delay: {delay}
-        }});
-        
-        // Store original GeolocationService
-        if (!window._OriginalGeolocationService) {{
-            window._OriginalGeolocationService = window.GeolocationService;
-        }}
-        
-        // Override GeolocationService to use mock provider
-        window.GeolocationService = function(locationResult, provider, pm, config) {{
-            // Always use test mock provider instead of browser geolocation
-            console.log('[TEST] GeolocationService created with MockGeolocationProvider');
-            return new window._OriginalGeolocationService(
-                locationResult,
-                window.TEST_MOCK_PROVIDER,  // Force mock provider
-                pm,
-                config
-            );
-        }};
-        
-        // Maintain prototype chain for proper inheritance
-        window.GeolocationService.prototype = window._OriginalGeolocationService.prototype;
-        Object.setPrototypeOf(window.GeolocationService, window._OriginalGeolocationService);
-        
-        console.log('[TEST] MockGeolocationProvider configured successfully');
-        console.log('[TEST] Test coordinates:', {latitude}, {longitude});
-        
-        return {{
-            success: true,
-            coordinates: {{
-                latitude: {latitude},
-                longitude: {longitude},
-                accuracy: {accuracy}
-            }},
-            providerType: 'MockGeolocationProvider'
-        }};
-        
-    }} catch (error) {{
-        console.error('[TEST] Failed to configure mock:', error);
-        return {{
-            success: false,
-            error: error.message,
-            stack: error.stack
-        }};
-    }}
-    """
-    
-    result = driver.execute_script(mock_setup_script)
+    # Execute mock setup script; values travel as JSON-encoded arguments
+    result = driver.execute_script(_SETUP_JS, latitude, longitude, accuracy, delay)
+    if cached and not (result or {}).get('success'):
+        # Readiness was remembered from a previous page: wait again and retry
+        _READY_DRIVERS.discard(driver)
+        return setup_mock_geolocation(driver, latitude, longitude, accuracy, delay)
     return result
 
 
@@ -216,8 +261,6 @@ def test_mock_provider_directly(driver, timeout=5):
     Returns:
         dict: Test result with coordinates or error
     """
-    driver.set_script_timeout(timeout)
-    
     test_script = """
     const done = arguments[0];
     
@@ -260,14 +303,21 @@ def test_mock_provider_directly(driver, timeout=5):
     }
     """
     
-    return driver.execute_async_script(test_script)
+    previous_timeout = driver.timeouts.script
+    driver.set_script_timeout(timeout)
+    try:
+        return driver.execute_async_script(test_script)
+    finally:
+        driver.set_script_timeout(previous_timeout)
 
 
 def reset_geolocation_service(driver):
     """
     Reset GeolocationService to original implementation.
     
-    Call this after tests to restore the original behavior.
+    Call this after tests to restore the original behavior. Also restores
+    BrowserGeolocationProvider.prototype.getCurrentPosition if a test
+    replaced it and saved the original as window._OriginalGetCurrentPosition.
     
     Args:
         driver: Selenium WebDriver instance
@@ -275,17 +325,29 @@ def reset_geolocation_service(driver):
     Returns:
         bool: True if reset successfully
     """
+    _READY_DRIVERS.discard(driver)
+
     reset_script = """
     try {
+        let reset = false;
         if (window._OriginalGeolocationService) {
             window.GeolocationService = window._OriginalGeolocationService;
             delete window._OriginalGeolocationService;
+            console.log('[TEST] GeolocationService reset to original');
+            reset = true;
+        }
+        if (window._OriginalGetCurrentPosition) {
+            window.BrowserGeolocationProvider.prototype.getCurrentPosition =
+                window._OriginalGetCurrentPosition;
+            delete window._OriginalGetCurrentPosition;
+            console.log('[TEST] BrowserGeolocationProvider reset to original');
+            reset = true;
+        }
+        if (reset) {
             delete window.TEST_MOCK_PROVIDER;
             delete window.TEST_POSITION;
-            console.log('[TEST] GeolocationService reset to original');
-            return true;
         }
-        return false;
+        return reset;
     } catch (error) {
         console.error('[TEST] Reset failed:', error);
         return false;
@@ -307,16 +369,16 @@ def create_custom_position(latitude, longitude, accuracy=DEFAULT_ACCURACY, **kwa
         
     Returns:
         dict: Position object compatible with Geolocation API
+        (timestamp defaults to the current time in epoch milliseconds)
     """
+    coords = {
+        'latitude': latitude,
+        'longitude': longitude,
+        'accuracy': accuracy,
+        **_OPTIONAL_COORDS,
+        **{key: kwargs[key] for key in _OPTIONAL_COORDS.keys() & kwargs.keys()}
+    }
     return {
-        'coords': {
-            'latitude': latitude,
-            'longitude': longitude,
-            'accuracy': accuracy,
-            'altitude': kwargs.get('altitude'),
-            'altitudeAccuracy': kwargs.get('altitudeAccuracy'),
-            'heading': kwargs.get('heading'),
-            'speed': kwargs.get('speed')
-        },
-        'timestamp': kwargs.get('timestamp', 'Date.now()')
+        'coords': coords,
+        'timestamp': kwargs.get('timestamp', int(time.time() * 1000))
     }
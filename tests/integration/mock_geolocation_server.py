@@ -3,12 +3,27 @@ Simple HTTP server that returns mock geolocation data for Firefox.
 This server provides a Mozilla Location Service (MLS) compatible API response.
 """
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import os
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Per-request logging to stdout; off unless MOCK_GEO_DEBUG is set
+DEBUG = bool(os.environ.get("MOCK_GEO_DEBUG"))
 
 class MockGeolocationHandler(BaseHTTPRequestHandler):
     # Test coordinates: Milho Verde, Serro, MG
     MOCK_LAT = -18.4696091
     MOCK_LON = -43.4953982
+
+    # MLS-compatible response body; the coordinates never change, so it is
+    # serialized once at class creation
+    _RESPONSE_BYTES = json.dumps({
+        "location": {
+            "lat": MOCK_LAT,
+            "lng": MOCK_LON
+        },
+        "accuracy": 10.0
+    }).encode()
+    _RESPONSE_LEN = str(len(_RESPONSE_BYTES))
     
     def do_GET(self):
         """Handle GET requests for geolocation data."""
@@ -16,38 +31,35 @@ class MockGeolocationHandler(BaseHTTPRequestHandler):
     
     def do_POST(self):
         """Handle POST requests for geolocation data."""
-        content_length = int(self.headers.get('Content-Length', 0))
-        if content_length > 0:
-            body = self.rfile.read(content_length)
-            print(f"[MOCK SERVER] Received POST request: {body.decode('utf-8', errors='ignore')}")
+        # The response doesn't depend on the body, so only read it to log it.
+        # Unread bodies are harmless: HTTP/1.0 closes the connection after
+        # each response.
+        if DEBUG:
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length > 0:
+                body = self.rfile.read(content_length)
+                print(f"[MOCK SERVER] Received POST request: {body.decode('utf-8', errors='ignore')}")
         
         self.send_geolocation_response()
     
     def send_geolocation_response(self):
         """Send MLS-compatible geolocation response."""
-        # Return MLS-compatible response
-        response = {
-            "location": {
-                "lat": self.MOCK_LAT,
-                "lng": self.MOCK_LON
-            },
-            "accuracy": 10.0
-        }
-        
-        print(f"[MOCK SERVER] Sending response: {response}")
-        
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', self._RESPONSE_LEN)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(self._RESPONSE_BYTES)
     
     def log_message(self, format, *args):
-        """Log all requests for debugging."""
-        print(f"[MOCK SERVER] {format % args}")
+        """Log requests for debugging when MOCK_GEO_DEBUG is set."""
+        if DEBUG:
+            print(f"[MOCK SERVER] {format % args}")
 
 if __name__ == '__main__':
-    server = HTTPServer(('127.0.0.1', 9876), MockGeolocationHandler)
+    # One (daemon) thread per request so concurrent geolocation lookups
+    # don't queue behind each other
+    server = ThreadingHTTPServer(('127.0.0.1', 9876), MockGeolocationHandler)
     print(f"Mock geolocation server running on http://127.0.0.1:9876")
     print(f"Serving coordinates: lat={MockGeolocationHandler.MOCK_LAT}, lng={MockGeolocationHandler.MOCK_LON}")
     server.serve_forever()
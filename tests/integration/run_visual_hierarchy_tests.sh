@@ -1,10 +1,8 @@
 #!/bin/bash
 # Run Visual Hierarchy Integration Tests
 #
-# This script:
-# 1. Starts a local HTTP server
-# 2. Runs Selenium tests for visual hierarchy
-# 3. Cleans up the server
+# This script runs the Selenium tests for visual hierarchy. The tests serve
+# src/ themselves (base_url fixture in conftest.py), so no server is needed.
 #
 # Usage: ./run_visual_hierarchy_tests.sh
 
@@ -39,29 +37,17 @@ if ! python3 -c "import selenium" 2>/dev/null; then
     pip3 install selenium
 fi
 
-# Start local HTTP server
-echo -e "${YELLOW}Starting local HTTP server on port 8080...${NC}"
-python3 -m http.server 8080 --directory src > /tmp/test_server.log 2>&1 &
-SERVER_PID=$!
-
-# Wait for server to start
-sleep 2
-
-# Check if server is running
-if ! curl -s http://localhost:8080 > /dev/null; then
-    echo -e "${RED}Error: Failed to start HTTP server${NC}"
-    kill $SERVER_PID 2>/dev/null || true
-    exit 1
+# Check if pytest is installed
+if ! python3 -c "import pytest" 2>/dev/null; then
+    echo -e "${YELLOW}Installing pytest...${NC}"
+    pip3 install pytest
 fi
 
-echo -e "${GREEN}✓ Server started (PID: $SERVER_PID)${NC}"
-echo ""
-
 # Run the tests
 echo -e "${YELLOW}Running Selenium tests...${NC}"
 echo ""
 
-if python3 tests/integration/test_visual_hierarchy.py; then
+if python3 -m pytest tests/integration/test_visual_hierarchy.py -v; then
     echo ""
     echo -e "${GREEN}========================================${NC}"
     echo -e "${GREEN}✓ All tests passed!${NC}"
@@ -75,11 +61,4 @@ else
     TEST_RESULT=1
 fi
 
-# Clean up
-echo ""
-echo -e "${YELLOW}Cleaning up...${NC}"
-kill $SERVER_PID 2>/dev/null || true
-wait $SERVER_PID 2>/dev/null || true
-echo -e "${GREEN}✓ Server stopped${NC}"
-
 exit $TEST_RESULT
@@ -5,8 +5,11 @@ Tests the functionality of capturing JavaScript console logs from Firefox
 browser during Selenium test execution.
 """
 
+import asyncio
+import urllib.request
+
 import pytest
-import time
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -17,6 +20,59 @@ from firefox_console_capture import (
 )
 
 
+def _wait_for_message(
+    driver,
+    console: FirefoxConsoleCapture,
+    substring: str,
+    level: str | None = None,
+    timeout: float = 2.0,
+    poll: float = 0.05,
+) -> list[ConsoleLogEntry]:
+    """
+    Poll captured logs until one contains ``substring``.
+
+    Returns the logs from the poll that found it, or from the last poll if
+    it never showed up, so the caller's assertions report what was captured.
+    """
+    return _wait_for_messages(driver, console, [substring], level, timeout, poll)
+
+
+def _wait_for_messages(
+    driver,
+    console: FirefoxConsoleCapture,
+    substrings: list[str],
+    level: str | None = None,
+    timeout: float = 2.0,
+    poll: float = 0.05,
+) -> list[ConsoleLogEntry]:
+    """Poll captured logs until every substring appears in some message."""
+    logs: list[ConsoleLogEntry] = []
+
+    def found(_driver) -> bool:
+        nonlocal logs
+        logs = console.get_logs(level)
+        messages = [log["message"] for log in logs]
+        return all(any(s in msg for msg in messages) for s in substrings)
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(found)
+    except TimeoutException:
+        pass
+    return logs
+
+
+def _execute_and_wait_for_logs(
+    driver,
+    console: FirefoxConsoleCapture,
+    js: str,
+    expected_substrings: list[str],
+    timeout: float = 2.0,
+) -> list[ConsoleLogEntry]:
+    """Run ``js`` in one round-trip, then wait for all expected messages."""
+    driver.execute_script(js)
+    return _wait_for_messages(driver, console, expected_substrings, timeout=timeout)
+
+
 class TestConsoleLogCapture:
     """Test suite for FirefoxConsoleCapture class."""
 
@@ -39,11 +95,9 @@ class TestConsoleLogCapture:
         with pytest.raises(TypeError, match="Expected webdriver.Firefox"):
             FirefoxConsoleCapture("not_a_driver")
 
-    def test_inject_console_listener(self, firefox_driver, base_url):
+    def test_inject_console_listener(self, firefox_driver, index_page):
         """Test that console listener is injected successfully."""
         console = FirefoxConsoleCapture(firefox_driver)
-        firefox_driver.get(f"{base_url}/index.html")
-
         console._inject_console_listener()
 
         assert console._listener_injected is True
@@ -54,22 +108,20 @@ class TestConsoleLogCapture:
         )
         assert version == "1.0.0"
 
-    def test_capture_console_log(self, firefox_driver, console_capture, base_url):
+    def test_capture_console_log(self, firefox_driver, console_capture, index_page):
         
         print(f"Type: {type(console_capture)}")
 
         """Test capturing console.log() messages."""
-        firefox_driver.get(f"{base_url}/index.html")
-        
         # Clear any existing logs from page load
         console_capture.clear_logs()
 
         # Execute JavaScript that logs to console
         firefox_driver.execute_script("console.log('Test message from Selenium');")
 
-        time.sleep(0.3)  # Brief wait for log capture
-
-        logs = console_capture.get_logs()
+        logs = _wait_for_message(
+            firefox_driver, console_capture, "Test message from Selenium"
+        )
         print(f"Logs: {logs}")
 
         # Find our test message
@@ -77,58 +129,52 @@ class TestConsoleLogCapture:
         assert len(test_logs) > 0, f"Expected log not found. Got {len(logs)} logs: {[l['message'][:50] for l in logs[:5]]}"
         assert test_logs[0]["level"] == "INFO"
 
-    def test_capture_console_error(self, firefox_driver, console_capture, base_url):
+    def test_capture_console_error(self, firefox_driver, console_capture, index_page):
         """Test capturing console.error() messages."""
-        firefox_driver.get(f"{base_url}/index.html")
-        
         # Clear existing logs
         console_capture.clear_logs()
 
         # Execute JavaScript that logs an error
         firefox_driver.execute_script("console.error('Test error message');")
 
-        time.sleep(0.3)
-
-        errors = console_capture.get_errors()
+        errors = _wait_for_message(
+            firefox_driver, console_capture, "Test error message", level="ERROR"
+        )
 
         error_messages = [e["message"] for e in errors]
         assert any("Test error message" in msg for msg in error_messages), f"Expected error not found in {error_messages}"
 
-    def test_capture_console_warn(self, firefox_driver, console_capture, base_url):
+    def test_capture_console_warn(self, firefox_driver, console_capture, index_page):
         """Test capturing console.warn() messages."""
-        firefox_driver.get(f"{base_url}/index.html")
-        
         # Clear existing logs
         console_capture.clear_logs()
 
         firefox_driver.execute_script("console.warn('Test warning message');")
 
-        time.sleep(0.3)
-
-        warnings = console_capture.get_warnings()
+        warnings = _wait_for_message(
+            firefox_driver, console_capture, "Test warning message", level="WARNING"
+        )
 
         warning_messages = [w["message"] for w in warnings]
         assert any("Test warning message" in msg for msg in warning_messages), f"Expected warning not found in {warning_messages}"
 
-    def test_capture_multiple_log_levels(self, firefox_driver, console_capture, base_url):
+    def test_capture_multiple_log_levels(self, firefox_driver, console_capture, index_page):
         """Test capturing logs of different levels."""
-        firefox_driver.get(f"{base_url}/index.html")
-        
         # Clear existing page logs
         console_capture.clear_logs()
 
-        # Log multiple messages of different levels
-        firefox_driver.execute_script("""
+        # Log multiple messages of different levels and wait for them
+        all_logs = _execute_and_wait_for_logs(
+            firefox_driver,
+            console_capture,
+            """
             console.log('Info message');
             console.warn('Warning message');
             console.error('Error message');
             console.debug('Debug message');
-        """)
-
-        time.sleep(0.3)
-
-        # Get all logs
-        all_logs = console_capture.get_logs()
+            """,
+            ["Info message", "Warning message", "Error message"],
+        )
 
         # Verify our test messages are captured
         messages = [log["message"] for log in all_logs]
@@ -141,24 +187,23 @@ class TestConsoleLogCapture:
         error_messages = [e["message"] for e in errors]
         assert any("Error message" in msg for msg in error_messages), f"Error message not in errors: {error_messages}"
 
-    def test_capture_javascript_error(self, firefox_driver, console_capture, base_url):
+    def test_capture_javascript_error(self, firefox_driver, console_capture, index_page):
         """Test capturing JavaScript console.error() calls."""
-        firefox_driver.get(f"{base_url}/index.html")
-        
         # Clear existing logs
         console_capture.clear_logs()
 
         # Log errors using console.error (most reliable way to capture errors)
         # Note: Thrown errors in async contexts (setTimeout) may not always be captured
         # by window.onerror, so we test console.error directly which is the primary use case
-        firefox_driver.execute_script("""
+        # The script returns once the async error has been logged
+        firefox_driver.execute_async_script("""
+            const done = arguments[arguments.length - 1];
             setTimeout(function() {
                 console.error('Intentional test error XYZ123');
+                done();
             }, 100);
         """)
 
-        time.sleep(0.5)  # Wait for async error to be logged
-
         errors = console_capture.get_errors()
 
         # Should capture the error
@@ -166,19 +211,18 @@ class TestConsoleLogCapture:
         assert any("Intentional test error XYZ123" in msg for msg in error_messages), \
             f"Expected error not found. Got errors: {error_messages}"
 
-    def test_clear_logs(self, firefox_driver, console_capture, base_url):
+    def test_clear_logs(self, firefox_driver, console_capture, index_page):
         """Test clearing captured logs."""
-        firefox_driver.get(f"{base_url}/index.html")
-
         # Inject listener and get initial state
         console_capture._inject_console_listener()
         
-        # Log some messages
-        firefox_driver.execute_script("console.log('Message before clear');")
-        time.sleep(0.2)
-
-        # Verify logs exist
-        logs_before = console_capture.get_logs()
+        # Log some messages and verify they exist
+        logs_before = _execute_and_wait_for_logs(
+            firefox_driver,
+            console_capture,
+            "console.log('Message before clear');",
+            ["Message before clear"],
+        )
         messages_before = [log["message"] for log in logs_before]
         assert any("Message before clear" in msg for msg in messages_before), \
             f"Initial message not found in {messages_before[:5]}"
@@ -187,10 +231,12 @@ class TestConsoleLogCapture:
         console_capture.clear_logs()
 
         # Log new message
-        firefox_driver.execute_script("console.log('Message after clear');")
-        time.sleep(0.2)
-
-        logs_after = console_capture.get_logs()
+        logs_after = _execute_and_wait_for_logs(
+            firefox_driver,
+            console_capture,
+            "console.log('Message after clear');",
+            ["Message after clear"],
+        )
 
         # Should only have message after clear
         messages = [log["message"] for log in logs_after]
@@ -199,10 +245,8 @@ class TestConsoleLogCapture:
         assert not any("Message before clear" in msg for msg in messages), \
             f"Old message still present after clear"
 
-    def test_wait_for_log(self, firefox_driver, console_capture, base_url):
+    def test_wait_for_log(self, firefox_driver, console_capture, index_page):
         """Test waiting for a specific log message."""
-        firefox_driver.get(f"{base_url}/index.html")
-
         # Log message after delay
         firefox_driver.execute_script("""
             setTimeout(function() {
@@ -216,19 +260,15 @@ class TestConsoleLogCapture:
         assert log is not None
         assert "Delayed message" in log["message"]
 
-    def test_wait_for_log_timeout(self, firefox_driver, console_capture, base_url):
+    def test_wait_for_log_timeout(self, firefox_driver, console_capture, index_page):
         """Test wait_for_log timeout behavior."""
-        firefox_driver.get(f"{base_url}/index.html")
-
         # Wait for log that never appears
         log = console_capture.wait_for_log(r"Non-existent message", timeout=1.0)
 
         assert log is None
 
-    def test_wait_for_log_with_pattern(self, firefox_driver, console_capture, base_url):
+    def test_wait_for_log_with_pattern(self, firefox_driver, console_capture, index_page):
         """Test wait_for_log with regex pattern."""
-        firefox_driver.get(f"{base_url}/index.html")
-
         firefox_driver.execute_script("""
             setTimeout(function() {
                 console.log('API call completed: status 200');
@@ -241,57 +281,56 @@ class TestConsoleLogCapture:
         assert log is not None
         assert "API call completed" in log["message"]
 
-    def test_has_errors(self, firefox_driver, console_capture, base_url):
+    def test_has_errors(self, firefox_driver, console_capture, index_page):
         """Test has_errors() method."""
-        firefox_driver.get(f"{base_url}/index.html")
-
         # Initially should have no errors (or ignore existing)
         console_capture.clear_logs()
 
         # Log an error
         firefox_driver.execute_script("console.error('Test error');")
-        time.sleep(0.2)
+        _wait_for_message(firefox_driver, console_capture, "Test error", level="ERROR")
 
         assert console_capture.has_errors() is True
 
-    def test_assert_no_errors_passes(self, firefox_driver, console_capture, base_url):
+    def test_assert_no_errors_passes(self, firefox_driver, console_capture, index_page):
         """Test assert_no_errors() passes when no errors exist."""
-        firefox_driver.get(f"{base_url}/index.html")
         console_capture.clear_logs()
 
         # Log only info messages
         firefox_driver.execute_script("console.log('Info message');")
-        time.sleep(0.2)
+        _wait_for_message(firefox_driver, console_capture, "Info message")
 
         # Should not raise
         console_capture.assert_no_errors()
 
-    def test_assert_no_errors_fails(self, firefox_driver, console_capture, base_url):
+    def test_assert_no_errors_fails(self, firefox_driver, console_capture, index_page):
         """Test assert_no_errors() fails when errors exist."""
-        firefox_driver.get(f"{base_url}/index.html")
         console_capture.clear_logs()
 
         # Log an error
         firefox_driver.execute_script("console.error('Test error');")
-        time.sleep(0.2)
+        _wait_for_message(firefox_driver, console_capture, "Test error", level="ERROR")
 
         # Should raise AssertionError
         with pytest.raises(AssertionError, match="Console errors detected"):
             console_capture.assert_no_errors()
 
-    def test_get_log_summary(self, firefox_driver, console_capture, base_url):
+    def test_get_log_summary(self, firefox_driver, console_capture, index_page):
         """Test get_log_summary() method."""
-        firefox_driver.get(f"{base_url}/index.html")
         console_capture.clear_logs()
 
         # Log messages of different levels
-        firefox_driver.execute_script("""
+        _execute_and_wait_for_logs(
+            firefox_driver,
+            console_capture,
+            """
             console.log('Info 1');
             console.log('Info 2');
             console.warn('Warning 1');
             console.error('Error 1');
-        """)
-        time.sleep(0.3)
+            """,
+            ["Info 1", "Info 2", "Warning 1", "Error 1"],
+        )
 
         summary = console_capture.get_log_summary()
 
@@ -303,15 +342,13 @@ class TestConsoleLogCapture:
         assert summary["WARNING"] >= 1
         assert summary["INFO"] >= 2
 
-    def test_log_entry_structure(self, firefox_driver, console_capture, base_url):
+    def test_log_entry_structure(self, firefox_driver, console_capture, index_page):
         """Test that log entries have correct structure."""
-        firefox_driver.get(f"{base_url}/index.html")
         console_capture.clear_logs()
 
         firefox_driver.execute_script("console.log('Structured log test');")
-        time.sleep(0.2)
 
-        logs = console_capture.get_logs()
+        logs = _wait_for_message(firefox_driver, console_capture, "Structured log test")
         test_logs = [log for log in logs if "Structured log test" in log["message"]]
 
         assert len(test_logs) > 0
@@ -332,35 +369,35 @@ class TestConsoleLogCapture:
         assert isinstance(log["message"], str)
         assert isinstance(log["source"], str)
 
-    def test_auto_clear_config(self, firefox_driver, base_url):
+    def test_auto_clear_config(self, firefox_driver, index_page):
         """Test auto_clear configuration."""
         config = ConsoleConfig(auto_clear=True)
         console = FirefoxConsoleCapture(firefox_driver, config=config)
 
-        firefox_driver.get(f"{base_url}/index.html")
+        console._inject_console_listener()
 
         # First log
         firefox_driver.execute_script("console.log('First message');")
-        time.sleep(0.2)
 
-        logs1 = console.get_logs()  # Should auto-clear after this
+        # Should auto-clear after the retrieval that sees it
+        logs1 = _wait_for_message(firefox_driver, console, "First message")
 
         # Second log
         firefox_driver.execute_script("console.log('Second message');")
-        time.sleep(0.2)
 
-        logs2 = console.get_logs()
+        logs2 = _wait_for_message(firefox_driver, console, "Second message")
 
         # With auto_clear, logs2 should not contain logs1 messages
         messages2 = [log["message"] for log in logs2]
         assert any("Second message" in msg for msg in messages2)
 
-    def test_max_entries_config(self, firefox_driver, base_url):
+    @pytest.mark.fresh_page
+    def test_max_entries_config(self, firefox_driver, index_page):
         """Test max_entries configuration limits returned logs."""
         config = ConsoleConfig(max_entries=5)
         console = FirefoxConsoleCapture(firefox_driver, config=config)
 
-        firefox_driver.get(f"{base_url}/index.html")
+        console._inject_console_listener()
 
         # Log many messages
         firefox_driver.execute_script("""
@@ -368,19 +405,193 @@ class TestConsoleLogCapture:
                 console.log('Message ' + i);
             }
         """)
-        time.sleep(0.3)
 
-        logs = console.get_logs()
+        logs = _wait_for_message(firefox_driver, console, "Message 19")
 
         # Should be limited to max_entries
         assert len(logs) <= config.max_entries
 
-    def test_console_capture_with_real_page(self, firefox_driver, console_capture, base_url):
-        """Test console capture on actual Guia Turístico page."""
-        firefox_driver.get(f"{base_url}/index.html")
+    def test_repeated_logs_fold_into_count(self, firefox_driver, console_capture, index_page):
+        """Test identical consecutive logs become one entry with a count."""
+        console_capture.clear_logs()
+
+        logs = _execute_and_wait_for_logs(
+            firefox_driver,
+            console_capture,
+            "for (let i = 0; i < 3; i++) { console.log('Repeated message'); }",
+            ["Repeated message"],
+        )
+
+        repeated = [log for log in logs if log["message"] == "Repeated message"]
+        assert [log["count"] for log in repeated] == [3]
+        assert console_capture.get_log_summary()["INFO"] >= 3
+
+    def test_repeat_after_read_starts_new_entry(self, firefox_driver, console_capture, index_page):
+        """Test a repeat of an entry already retrieved is not folded into it."""
+        console_capture.clear_logs()
+
+        firefox_driver.execute_script("console.log('Read then repeated');")
+        _wait_for_message(firefox_driver, console_capture, "Read then repeated")
+
+        firefox_driver.execute_script("console.log('Read then repeated');")
+        WebDriverWait(firefox_driver, 2, poll_frequency=0.05).until(
+            lambda d: len(
+                [l for l in console_capture.get_logs() if l["message"] == "Read then repeated"]
+            ) >= 2
+        )
+
+        repeated = [
+            log for log in console_capture.get_logs()
+            if log["message"] == "Read then repeated"
+        ]
+        assert [log["count"] for log in repeated] == [1, 1]
+
+    def test_different_message_breaks_folding(self, firefox_driver, console_capture, index_page):
+        """Test only consecutive identical logs are folded."""
+        console_capture.clear_logs()
+
+        logs = _execute_and_wait_for_logs(
+            firefox_driver,
+            console_capture,
+            """
+            console.log('Fold A');
+            console.log('Fold B');
+            console.log('Fold A');
+            """,
+            ["Fold A", "Fold B"],
+        )
+
+        folded = [(log["message"], log["count"]) for log in logs if log["message"].startswith("Fold ")]
+        assert folded == [("Fold A", 1), ("Fold B", 1), ("Fold A", 1)]
+
+    @pytest.mark.fresh_page
+    def test_ring_buffer_overflow_keeps_newest(self, firefox_driver, index_page):
+        """Test overflowing max_entries keeps the newest entries in order."""
+        config = ConsoleConfig(max_entries=5)
+        console = FirefoxConsoleCapture(firefox_driver, config=config)
+        console.clear_logs()
+
+        try:
+            logs = _execute_and_wait_for_logs(
+                firefox_driver,
+                console,
+                "for (let i = 0; i < 12; i++) { console.log('Overflow ' + i); }",
+                ["Overflow 11"],
+            )
+        finally:
+            # Put the default-sized listener back for later pages and tests
+            FirefoxConsoleCapture(firefox_driver)._inject_console_listener()
+
+        overflow = [log["message"] for log in logs if log["message"].startswith("Overflow ")]
+        assert 0 < len(overflow) <= config.max_entries
+        assert overflow == [f"Overflow {i}" for i in range(12 - len(overflow), 12)]
+
+    def test_get_logs_level_is_incremental(self, firefox_driver, console_capture, index_page):
+        """Test repeated get_logs(level=...) calls add new entries only once."""
+        console_capture.clear_logs()
+
+        firefox_driver.execute_script("console.error('Level error 1');")
+        _wait_for_message(firefox_driver, console_capture, "Level error 1", level="ERROR")
+
+        firefox_driver.execute_script(
+            "console.log('Level info'); console.error('Level error 2');"
+        )
+        errors = _wait_for_message(
+            firefox_driver, console_capture, "Level error 2", level="ERROR"
+        )
+
+        messages = [log["message"] for log in errors]
+        assert messages.count("Level error 1") == 1
+        assert messages.count("Level error 2") == 1
+        assert all(log["level"] == "ERROR" for log in errors)
+
+        # The unfiltered view has its own cursor and still sees everything
+        all_messages = [log["message"] for log in console_capture.get_logs()]
+        for message in ("Level error 1", "Level info", "Level error 2"):
+            assert all_messages.count(message) == 1
+
+    def test_clear_by_other_capture_resets_logs(self, firefox_driver, console_capture, index_page):
+        """Test a buffer cleared elsewhere (new epoch) drops accumulated logs."""
+        console_capture.clear_logs()
+
+        firefox_driver.execute_script("console.log('Before other clear');")
+        _wait_for_message(firefox_driver, console_capture, "Before other clear")
+
+        FirefoxConsoleCapture(firefox_driver).clear_logs()
+        firefox_driver.execute_script("console.log('After other clear');")
+        logs = _wait_for_message(firefox_driver, console_capture, "After other clear")
+
+        messages = [log["message"] for log in logs]
+        assert "After other clear" in messages
+        assert "Before other clear" not in messages
+
+    def test_cache_ttl_reuses_result(self, firefox_driver, index_page):
+        """Test cache_ttl returns the previous result within the TTL."""
+        cached = FirefoxConsoleCapture(firefox_driver, config=ConsoleConfig(cache_ttl=60))
+        cached.clear_logs()
+        first = cached.get_logs()
+
+        firefox_driver.execute_script("console.log('Logged while cached');")
+        # The default capture (no cache) sees the new log...
+        _wait_for_message(
+            firefox_driver, FirefoxConsoleCapture(firefox_driver), "Logged while cached"
+        )
+
+        # ...while the cached capture still returns its earlier result
+        assert cached.get_logs() == first
+
+    def test_reinject_if_needed(self, firefox_driver, console_capture, index_page):
+        """Test reinject_if_needed only installs the listener when it is missing."""
+        console_capture._inject_console_listener()
+        assert console_capture.reinject_if_needed() is False
+
+        # After a navigation the listener is back (preload script) or reinjected
+        firefox_driver.get(index_page)
+        console_capture.reinject_if_needed()
 
+        firefox_driver.execute_script("console.log('After reinject');")
+        logs = _wait_for_message(firefox_driver, console_capture, "After reinject")
+        assert any(log["message"] == "After reinject" for log in logs)
+
+    def test_wait_for_log_async(self, firefox_driver, console_capture, index_page):
+        """Test waiting for a log from a coroutine."""
+        firefox_driver.execute_script("""
+            setTimeout(function() {
+                console.log('Async delayed message');
+            }, 300);
+        """)
+
+        log = asyncio.run(
+            console_capture.wait_for_log_async(r"Async delayed", timeout=2.0)
+        )
+
+        assert log is not None
+        assert log["message"] == "Async delayed message"
+
+    def test_bidi_events(self, firefox_driver, index_page):
+        """Test capturing logs as WebDriver BiDi events."""
+        console = FirefoxConsoleCapture(
+            firefox_driver, config=ConsoleConfig(bidi_events=True)
+        )
+        try:
+            if console._events is None:
+                pytest.skip("WebDriver BiDi log events not available")
+
+            firefox_driver.execute_script("console.warn('BiDi event message');")
+            log = console.wait_for_log(r"BiDi event message", timeout=2.0)
+
+            assert log is not None
+            assert log["level"] == "WARNING"
+        finally:
+            console.close()
+
+    @pytest.mark.fresh_page
+    def test_console_capture_with_real_page(self, firefox_driver, console_capture, index_page):
+        """Test console capture on actual Guia Turístico page."""
         # Wait for page to load
-        time.sleep(2)
+        WebDriverWait(firefox_driver, 5, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
 
         # Get all logs
         all_logs = console_capture.get_logs()
@@ -411,9 +622,12 @@ class TestConsoleCaptureWithPytest:
         assert console_capture_autoclear.config.auto_clear is True
 
     def test_base_url_fixture(self, base_url):
-        """Test that base_url fixture provides correct URL."""
+        """Test that base_url fixture provides an HTTP URL serving index.html."""
         assert isinstance(base_url, str)
-        assert "guia_turistico" in base_url
+        assert base_url.startswith(("http://", "https://"))
+        assert not base_url.endswith("/")
+        with urllib.request.urlopen(f"{base_url}/index.html", timeout=5) as response:
+            assert response.status == 200
 
     def test_wait_timeout_fixture(self, wait_timeout):
         """Test that wait_timeout fixture provides timeout value."""
@@ -421,37 +635,30 @@ class TestConsoleCaptureWithPytest:
         assert wait_timeout > 0
 
 
+@pytest.mark.xdist_group("parser")
 class TestConsoleLogParsing:
     """Test log parsing and level normalization."""
 
-    def test_parse_log_level_error(self, firefox_driver):
-        """Test parsing ERROR log level."""
-        console = FirefoxConsoleCapture(firefox_driver)
-        assert console._parse_log_level("ERROR") == "ERROR"
-        assert console._parse_log_level("SEVERE") == "ERROR"
-
-    def test_parse_log_level_warning(self, firefox_driver):
-        """Test parsing WARNING log level."""
-        console = FirefoxConsoleCapture(firefox_driver)
-        assert console._parse_log_level("WARNING") == "WARNING"
-        assert console._parse_log_level("WARN") == "WARNING"
-
-    def test_parse_log_level_info(self, firefox_driver):
-        """Test parsing INFO log level."""
-        console = FirefoxConsoleCapture(firefox_driver)
-        assert console._parse_log_level("INFO") == "INFO"
-        assert console._parse_log_level("LOG") == "INFO"
-
-    def test_parse_log_level_debug(self, firefox_driver):
-        """Test parsing DEBUG log level."""
-        console = FirefoxConsoleCapture(firefox_driver)
-        assert console._parse_log_level("DEBUG") == "DEBUG"
-
-    def test_parse_log_level_invalid(self, firefox_driver):
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("ERROR", "ERROR"),
+            ("SEVERE", "ERROR"),
+            ("WARNING", "WARNING"),
+            ("WARN", "WARNING"),
+            ("INFO", "INFO"),
+            ("LOG", "INFO"),
+            ("DEBUG", "DEBUG"),
+        ],
+    )
+    def test_parse_log_level(self, raw, expected):
+        """Test normalizing each known log level (no browser needed)."""
+        assert FirefoxConsoleCapture._parse_log_level(raw) == expected
+
+    def test_parse_log_level_invalid(self):
         """Test parsing invalid log level raises ValueError."""
-        console = FirefoxConsoleCapture(firefox_driver)
         with pytest.raises(ValueError, match="Unknown log level"):
-            console._parse_log_level("INVALID_LEVEL")
+            FirefoxConsoleCapture._parse_log_level("INVALID_LEVEL")
 
 
 if __name__ == "__main__":
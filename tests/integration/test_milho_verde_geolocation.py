@@ -22,16 +22,27 @@ of overriding navigator.geolocation. This provides more reliable testing that
 integrates properly with the application's dependency injection architecture.
 """
 
+import functools
+import json
+import os
+import re
 import unittest
 import time
+
+import pytest
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 
+from app_server import SRC_DIR, base_url
 from firefox_console_capture import (
     FirefoxConsoleCapture,
     ConsoleConfig
@@ -44,12 +55,212 @@ from mock_geolocation_helper import (
     reset_geolocation_service
 )
 
-class TestMilhoVerdeGeolocation(unittest.TestCase):
+# Headless by default (always on CI); set HEADLESS=false to watch the browser
+HEADLESS = bool(os.environ.get("CI")) or os.getenv("HEADLESS", "true").lower() != "false"
+
+# Set TEST_DEBUG=1 to print console logs and other diagnostics that cost
+# extra WebDriver round-trips
+TEST_DEBUG = bool(os.environ.get("TEST_DEBUG"))
+
+# Upper bounds so a slow page or script fails the test instead of hanging the
+# suite on geckodriver's 300s page-load default, in seconds
+PAGE_LOAD_TIMEOUT = 30
+SCRIPT_TIMEOUT = 15
+
+# Brazilian CEP format: 99999-999 or 99999999
+_CEP_RE = re.compile(r'\b\d{5}-?\d{3}\b')
+
+# Page text that identifies Minas Gerais
+_MG_KEYWORDS = ("minas gerais", "mg", "br-mg")
+
+# Nominatim reverse-geocoding response for the Milho Verde test coordinates,
+# served to the address converter instead of calling OpenStreetMap
+CANNED_MILHO_VERDE_JSON = {
+    "place_id": 0,
+    "osm_type": "node",
+    "lat": "-18.4696091",
+    "lon": "-43.4953982",
+    "class": "tourism",
+    "type": "camp_site",
+    "name": "Camping Nozinho",
+    "display_name": (
+        "Camping Nozinho, 172, Rua Direita, Milho Verde, Serro, "
+        "Minas Gerais, Região Sudeste, 39150-000, Brasil"
+    ),
+    "address": {
+        "tourism": "Camping Nozinho",
+        "house_number": "172",
+        "road": "Rua Direita",
+        "village": "Milho Verde",
+        "city": "Serro",
+        "state": "Minas Gerais",
+        "ISO3166-2-lvl4": "BR-MG",
+        "region": "Região Sudeste",
+        "postcode": "39150-000",
+        "country": "Brasil",
+        "country_code": "br",
+    },
+}
+_CANNED_MILHO_VERDE_BODY = json.dumps(CANNED_MILHO_VERDE_JSON)
+
+# Wraps window.fetch (once per page) so Nominatim requests resolve with arguments[0]
+_SERVE_NOMINATIM_JS = """
+const body = arguments[0];
+if (window.__cannedNominatim) {
+    return;
+}
+window.__cannedNominatim = true;
+window.fetch = new Proxy(window.fetch, {
+    apply(target, thisArg, args) {
+        const url = String((args[0] && args[0].url) || args[0]);
+        if (url.includes('nominatim')) {
+            return Promise.resolve(new Response(body, {
+                status: 200,
+                headers: { 'Content-Type': 'application/json' }
+            }));
+        }
+        return Reflect.apply(target, thisArg, args);
+    }
+});
+"""
+
+# Installs MockGeolocationProvider at (arguments[0], arguments[1]) behind
+# BrowserGeolocationProvider.prototype.getCurrentPosition; returns a status dict
+_INSTALL_MOCK_PROVIDER_JS = """
+const [latitude, longitude] = arguments;
+try {
+    // Create mock position object
+    window.TEST_POSITION = {
+        coords: {
+            latitude: latitude,
+            longitude: longitude,
+            accuracy: 10,
+            altitude: null,
+            altitudeAccuracy: null,
+            heading: null,
+            speed: null
+        },
+        timestamp: Date.now()
+    };
+
+    // Create MockGeolocationProvider instance
+    window.TEST_MOCK_PROVIDER = new window.MockGeolocationProvider({
+        defaultPosition: window.TEST_POSITION,
+        supported: true,
+        delay: 100
+    });
+
+    console.log('[TEST] Mock provider created');
+
+    // CRITICAL FIX: Override the provider's getCurrentPosition method, not GeolocationService
+    // GeolocationService internally calls this.provider.getCurrentPosition()
+    // So we need to replace the provider on ALL instances
+
+    // Override BrowserGeolocationProvider.prototype.getCurrentPosition
+    // This will affect all instances including the one in GeolocationService.
+    // The original is kept for reset_geolocation_service, since keep_page
+    // tests leave this page loaded for the next test.
+    if (!window._OriginalGetCurrentPosition) {
+        window._OriginalGetCurrentPosition = window.BrowserGeolocationProvider.prototype.getCurrentPosition;
+    }
+    window.BrowserGeolocationProvider.prototype.getCurrentPosition = function(successCallback, errorCallback, options) {
+        console.log('[TEST] BrowserGeolocationProvider.getCurrentPosition intercepted - using mock');
+        return window.TEST_MOCK_PROVIDER.getCurrentPosition(successCallback, errorCallback, options);
+    };
+
+    return {
+        success: true,
+        method: 'provider prototype override',
+        coordinates: {
+            latitude: latitude,
+            longitude: longitude,
+            accuracy: 10
+        }
+    };
+
+} catch (error) {
+    console.error('[TEST] Failed to inject mock:', error);
+    return {
+        success: false,
+        error: error.message,
+        stack: error.stack
+    };
+}
+"""
+
+# Fills the coordinate inputs with arguments[0]/[1] and clicks button arguments[2]
+_SUBMIT_COORDS_JS = """
+const [latitude, longitude, buttonId] = arguments;
+for (const [id, value] of [['latitude', latitude], ['longitude', longitude]]) {
+    const input = document.getElementById(id);
+    input.value = value;
+    input.dispatchEvent(new Event('input', { bubbles: true }));
+    input.dispatchEvent(new Event('change', { bubbles: true }));
+}
+document.getElementById(buttonId).click();
+"""
+
+# Returns a reused address converter page to its just-loaded state
+_RESET_CONVERTER_JS = """
+for (const id of ['latitude', 'longitude']) {
+    const input = document.getElementById(id);
+    if (input) {
+        input.value = '';
+    }
+}
+const result = document.getElementById('addressResult');
+if (result) {
+    result.innerHTML = '';
+}
+"""
+
+
+# Where Firefox is usually installed when FIREFOX_BIN is not set
+_FIREFOX_PATHS = (
+    '/usr/bin/firefox',
+    '/usr/bin/firefox-esr',
+    '/usr/bin/firefox-bin',
+    '/opt/firefox/firefox',
+    '/opt/firefox/firefox-bin',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_firefox_binary():
     """
-    Integration tests for Milho Verde, Serro, MG geolocation workflow.
-    
-    Tests the complete flow from mocked geolocation to address display,
-    following best practices for Selenium testing.
+    Locate the Firefox binary once per process.
+
+    The lookup runs on first use rather than at import, so pytest runs that
+    only use the shared ``firefox_driver`` fixture never stat these paths.
+
+    Returns:
+        str | None: First existing candidate path, or None to let
+        Selenium find Firefox itself
+    """
+    return next(
+        (path for path in (os.environ.get('FIREFOX_BIN'), *_FIREFOX_PATHS)
+         if path and os.path.exists(path)),
+        None
+    )
+
+
+def _get_or_skip(test, driver, url):
+    """Navigate to url, skipping the test if the load exceeds PAGE_LOAD_TIMEOUT."""
+    try:
+        driver.get(url)
+    except TimeoutException:
+        test.skipTest(f"Page load exceeded {PAGE_LOAD_TIMEOUT}s budget: {url}")
+
+
+class _MilhoVerdeTestCase(unittest.TestCase):
+    """
+    Shared Firefox setup, test data and helpers for the Milho Verde tests.
+
+    Under pytest the tests borrow the session-wide ``firefox_driver`` from
+    conftest.py, so a worker runs one Firefox for the whole session. Plain
+    ``unittest`` runs start a browser per class on first use instead. Under
+    pytest-xdist (``-n auto --dist loadgroup``) the subclasses are separate
+    xdist groups, so they run on different workers in parallel.
     """
 
     # Test coordinates for Milho Verde, Serro, MG
@@ -66,11 +277,60 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
     EXPECTED_POSTAL_CODE = "39150-000"
     EXPECTED_COUNTRY = "Brasil"
     EXPECTED_PLACE_NAME = "Camping Nozinho"
-    
+
+    driver = None
+    _owns_driver = False
+    _wait_driver = None
+    _console = None
+    _geo_override_driver = None
+
+    # Set by classes whose _firefox_options add launch-time preferences the
+    # shared session Firefox does not have; they start their own browser
+    _needs_own_browser = False
+
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _session_driver(cls, request):
+        """
+        Under pytest, use the session-scoped Firefox from conftest.py.
+
+        Its options carry the same preferences as _firefox_options, and the
+        timeouts _launch_firefox sets are applied for the class and restored
+        afterwards. Classes with _needs_own_browser launch their own Firefox
+        instead.
+        """
+        if cls._needs_own_browser:
+            cls._launch_firefox()
+            yield
+            return
+        try:
+            driver = request.getfixturevalue("firefox_driver")
+        except WebDriverException as e:
+            pytest.skip(f"Firefox WebDriver not available: {e.msg}")
+        cls.driver = driver
+        previous_timeouts = driver.timeouts
+        cls._apply_timeouts(driver)
+        yield
+        driver.timeouts = previous_timeouts
+
     @classmethod
     def setUpClass(cls):
-        """Set up Firefox WebDriver with geolocation mocking."""
+        """Set up timeouts; the driver comes from pytest or _launch_firefox."""
+        cls.base_url = base_url()
+        cls.wait_timeout = 20
+        cls.long_wait_timeout = 30  # For API calls
+
+    @classmethod
+    def _firefox_options(cls):
+        """
+        Firefox options with geolocation mocking; subclasses may add to them.
+
+        Keep the preferences in step with conftest.py's ``firefox_driver``,
+        which pytest runs use instead.
+        """
         firefox_options = Options()
+        # WebDriver BiDi carries the geolocation override (_override_geolocation)
+        firefox_options.enable_bidi = True
         
         # Firefox-specific preferences
         # Grant geolocation permission
@@ -83,65 +343,77 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         firefox_options.set_preference("dom.webnotifications.enabled", False)
         firefox_options.set_preference("dom.push.enabled", False)
         
-        # Performance optimizations
-        firefox_options.set_preference("browser.cache.disk.enable", False)
-        firefox_options.set_preference("browser.cache.memory.enable", False)
-        firefox_options.set_preference("browser.cache.offline.enable", False)
-        firefox_options.set_preference("network.http.use-cache", False)
-        
-        # Headless mode for CI/CD (comment out for debugging)
-        # firefox_options.add_argument("--headless")
+        # Performance optimizations. The HTTP cache stays on: app_server
+        # relies on it to skip re-fetching stylesheets and scripts.
+        # One content process and no UI animations are plenty for these tests
+        firefox_options.set_preference("dom.ipc.processCount", 1)
+        firefox_options.set_preference("toolkit.cosmeticAnimations.enabled", False)
+        # The tests only check text, so skip images, web fonts and media
+        firefox_options.set_preference("permissions.default.image", 2)
+        firefox_options.set_preference("gfx.downloadable_fonts.enabled", False)
+        firefox_options.set_preference("media.autoplay.default", 5)
+        
+        if HEADLESS:
+            firefox_options.add_argument("-headless")
+        # Start at the final window size instead of resizing after launch
+        firefox_options.add_argument("--width=1920")
+        firefox_options.add_argument("--height=1080")
         
         # Set Firefox binary location explicitly
-        import os
-        
-        # Try multiple possible Firefox locations
-        firefox_paths = [
-            os.environ.get('FIREFOX_BIN'),
-            '/usr/bin/firefox',
-            '/usr/bin/firefox-esr',
-            '/usr/bin/firefox-bin',
-            '/opt/firefox/firefox',
-            '/opt/firefox/firefox-bin'
-        ]
-        
-        firefox_binary = None
-        for path in firefox_paths:
-            if path and os.path.exists(path):
-                firefox_binary = path
-                break
-        print(f"Using Firefox binary at: {firefox_binary}")
-
+        firefox_binary = _find_firefox_binary()
         if firefox_binary:
             firefox_options.binary_location = firefox_binary
-        
+        return firefox_options
+
+    @staticmethod
+    def _apply_timeouts(driver):
+        """Set the page-load and script budgets these tests are written for."""
+        # Explicit waits only; an implicit wait would stall every poll
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+
+    @classmethod
+    def _launch_firefox(cls):
+        """Start this class's own Firefox WebDriver (plain unittest runs)."""
         try:
-            cls.driver = webdriver.Firefox(options=firefox_options)
-            cls.driver.set_window_size(1920, 1080)
+            cls.driver = webdriver.Firefox(options=cls._firefox_options())
+            cls._apply_timeouts(cls.driver)
         except Exception as e:
             # If Firefox setup fails, skip tests instead of crashing
             print(f"WARNING: Could not initialize Firefox WebDriver: {e}")
             print("Skipping Selenium tests. Install Firefox and GeckoDriver to run these tests.")
             raise unittest.SkipTest("Firefox WebDriver not available")
-        
-        cls.base_url = "file:///home/mpb/Documents/GitHub/guia_turistico/src"
-        cls.wait_timeout = 20
-        cls.long_wait_timeout = 30  # For API calls
+        cls._owns_driver = True
 
     @classmethod
     def tearDownClass(cls):
-        """Clean up and close the browser."""
-        if hasattr(cls, 'driver') and cls.driver:
+        """Close the browser if this class started it."""
+        if cls._owns_driver and cls.driver:
             cls.driver.quit()
+            cls.driver = None
+            cls._owns_driver = False
+            cls._wait_driver = None
+            cls._console = None
 
     def setUp(self):
         """Set up before each test."""
-        self.wait = WebDriverWait(self.driver, self.wait_timeout)
-        self.long_wait = WebDriverWait(self.driver, self.long_wait_timeout)
+        cls = type(self)
+        if cls.driver is None:
+            cls._launch_firefox()
+        # The waits only depend on the driver, so build them once per driver
+        if cls._wait_driver is not cls.driver:
+            cls.wait = WebDriverWait(cls.driver, cls.wait_timeout)
+            cls.long_wait = WebDriverWait(cls.driver, cls.long_wait_timeout)
+            cls._wait_driver = cls.driver
+            cls._console = None
+        self._needs_geo_reset = False
 
     def tearDown(self):
         """Clean up after each test."""
-        # Reset geolocation service to original state
+        # Only tests that mocked geolocation need the service restored
+        if not self._needs_geo_reset:
+            return
         try:
             reset_geolocation_service(self.driver)
         except Exception as e:
@@ -171,6 +443,7 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
         
         # Grant geolocation permission
         chrome_options.add_experimental_option("prefs", {
@@ -179,7 +452,7 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
-            driver.set_window_size(1920, 1080)
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
             print(f"✅ Using Chrome at: {chrome_binary}")
             return driver
         except Exception as e:
@@ -198,6 +471,7 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         Returns:
             dict: Result with success status and coordinates
         """
+        self._needs_geo_reset = True
         result = setup_mock_geolocation(
             self.driver,
             latitude=self.TEST_LATITUDE,
@@ -215,6 +489,65 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         return result
 
 
+    def _override_geolocation(self):
+        """
+        Emulate the test coordinates in the browser itself.
+
+        Chrome takes the CDP ``Emulation.setGeolocationOverride`` command and
+        Firefox the WebDriver BiDi ``emulation.setGeolocationOverride`` one,
+        so the page's own navigator.geolocation answers without any script
+        injection, and before page code asks. The override is cleared again
+        when the test ends (_clear_geolocation_override), so it never leaks
+        into later tests on the shared driver.
+
+        Returns:
+            bool: True if the override is active, False if the driver
+            cannot emulate geolocation (use _mock_geolocation instead)
+        """
+        cls = type(self)
+        if cls._geo_override_driver is self.driver:
+            return True
+        try:
+            if hasattr(self.driver, "execute_cdp_cmd"):
+                self.driver.execute_cdp_cmd("Emulation.setGeolocationOverride", {
+                    "latitude": self.TEST_LATITUDE,
+                    "longitude": self.TEST_LONGITUDE,
+                    "accuracy": 10
+                })
+            else:
+                from selenium.webdriver.common.bidi.emulation import GeolocationCoordinates
+                self.driver.emulation.set_geolocation_override(
+                    coordinates=GeolocationCoordinates(
+                        self.TEST_LATITUDE, self.TEST_LONGITUDE, accuracy=10
+                    ),
+                    contexts=[self.driver.current_window_handle]
+                )
+        except (ImportError, AttributeError, WebDriverException) as e:
+            if TEST_DEBUG:
+                print(f"[TEST] Geolocation override unavailable: {e}")
+            return False
+        cls._geo_override_driver = self.driver
+        self.addCleanup(self._clear_geolocation_override)
+        return True
+
+    def _clear_geolocation_override(self):
+        """Drop the override set by _override_geolocation."""
+        cls = type(self)
+        driver = cls._geo_override_driver
+        cls._geo_override_driver = None
+        if driver is None:
+            return
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Emulation.clearGeolocationOverride", {})
+            else:
+                driver.emulation.set_geolocation_override(
+                    coordinates=None,
+                    contexts=[driver.current_window_handle]
+                )
+        except (AttributeError, WebDriverException) as e:
+            print(f"Warning: Could not clear geolocation override: {e}")
+
     def _wait_for_element_text(self, locator, timeout=None):
         """
         Wait for an element to have non-empty text.
@@ -227,18 +560,133 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
             WebElement with text content
         """
         wait = WebDriverWait(self.driver, timeout or self.wait_timeout)
-        return wait.until(lambda driver: driver.find_element(*locator) 
-                         if len(driver.find_element(*locator).text.strip()) > 0 
-                         else False)
 
-    def _scroll_to_element(self, element):
-        """Scroll element into view."""
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)  # Allow scroll animation
+        def has_text(driver):
+            element = driver.find_element(*locator)
+            return element if element.text.strip() else False
+
+        return wait.until(has_text)
+
+    def _wait_until(self, condition, timeout=None, driver=None):
+        """
+        Wait for a condition instead of sleeping for the worst case.
+
+        On timeout this returns None rather than raising, so the test's own
+        assertions report what the page actually shows.
+
+        Args:
+            condition: Callable taking the driver, truthy when ready
+            timeout: Optional timeout in seconds
+            driver: Optional driver (defaults to self.driver)
+
+        Returns:
+            The condition's truthy result, or None on timeout
+        """
+        wait = WebDriverWait(driver or self.driver, timeout or self.wait_timeout,
+                             poll_frequency=0.1)
+        try:
+            return wait.until(condition)
+        except TimeoutException:
+            return None
+
+    def _wait_for_address_result(self, element_id="addressResult", timeout=None):
+        """Wait until the converter has rendered something into element_id."""
+        return self._wait_until(
+            lambda d: d.find_element(By.ID, element_id)
+                       .get_attribute("innerHTML").strip() != "",
+            timeout=timeout or self.long_wait_timeout,
+        )
+
+    def _wait_for_location_result(self, driver=None):
+        """Wait until locationResult shows coordinates."""
+        # One script call per poll instead of find_element + get_attribute
+        return self._wait_until(
+            lambda d: d.execute_script(
+                "const el = document.getElementById('locationResult');"
+                "return !!el && el.innerHTML.includes('Latitude');"
+            ),
+            timeout=self.long_wait_timeout,
+            driver=driver,
+        )
+
+    def _console_capture(self):
+        """Console capture for the current driver, created on first use."""
+        cls = type(self)
+        if cls._console is None:
+            cls._console = FirefoxConsoleCapture(cls.driver)
+        else:
+            # The page may have been reloaded since the capture was created
+            cls._console.reinject_if_needed()
+        return cls._console
+
+    def _load_page(self, url, fresh=False):
+        """
+        Navigate to url unless the browser is already showing it.
+
+        Reusing the loaded page skips a full parse and module init. Tests
+        that need the app freshly initialized pass fresh=True.
+
+        Args:
+            url: Page URL
+            fresh: Always navigate, even if url is already loaded
+
+        Returns:
+            bool: True if the page was (re)loaded
+        """
+        if not fresh and self.driver.current_url == url:
+            return False
+        _get_or_skip(self, self.driver, url)
+        return True
+
+    def _load_converter(self):
+        """Open address-converter.html, resetting the form if it is reused."""
+        if not self._load_page(f"{self.base_url}/address-converter.html"):
+            self.driver.execute_script(_RESET_CONVERTER_JS)
+
+    def _address_result_html(self):
+        """
+        Fetch just the addressResult markup instead of the whole page source.
+
+        Returns:
+            str | None: innerHTML of #addressResult, or None if it is missing
+        """
+        return self.driver.execute_script(
+            "const el = document.getElementById('addressResult');"
+            "return el ? el.innerHTML : null;"
+        )
+
+    def _submit_coords(self, latitude, longitude, button_id="convertBtn"):
+        """
+        Fill the latitude/longitude inputs and click the convert button.
+
+        Done in one script call instead of a find_element/send_keys round-trip
+        per field; input and change events are dispatched as typing would.
+
+        Args:
+            latitude: Latitude value
+            longitude: Longitude value
+            button_id: ID of the button that submits the coordinates
+        """
+        self.driver.execute_script(_SUBMIT_COORDS_JS, str(latitude), str(longitude), button_id)
+
+    def _serve_canned_nominatim(self):
+        """Answer the loaded page's Nominatim requests with CANNED_MILHO_VERDE_JSON."""
+        self.driver.execute_script(_SERVE_NOMINATIM_JS, _CANNED_MILHO_VERDE_BODY)
+
+
+@pytest.mark.keep_page
+@pytest.mark.xdist_group("milho_verde_index")
+class TestMilhoVerdeGeolocation(_MilhoVerdeTestCase):
+    """
+    Integration tests for Milho Verde, Serro, MG geolocation workflow.
+    
+    Tests the complete flow from mocked geolocation to address display,
+    following best practices for Selenium testing.
+    """
 
     def test_01_page_loads_successfully(self):
         """Test that index page loads with all required elements."""
-        self.driver.get(f"{self.base_url}/index.html")
+        self._load_page(f"{self.base_url}/index.html")
 
         # Verify page title
         self.assertIn("Guia Turístico", self.driver.title)
@@ -259,27 +707,26 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
 
     def test_02_geolocation_mock_works(self):
         """Test that MockGeolocationProvider is functional and properly configured."""
-        self.driver.get(f"{self.base_url}/index.html")
-        print(f"Driver type: {type(self.driver)}")
-        print(f"Navigated to {self.driver.current_url}")
+        self._load_page(f"{self.base_url}/index.html")
+        if TEST_DEBUG:
+            print(f"Driver type: {type(self.driver)}")
+            print(f"Navigated to {self.driver.current_url}")
 
         # Wait for page to be ready
         self.wait.until(
             EC.presence_of_element_located((By.ID, "getLocationBtn"))
         )
         
-        console = FirefoxConsoleCapture(self.driver)
-        print(f"Console capture initialized: {type(console)}")
-        logs = console.get_logs()
-        print(f"Initial console logs: {logs}")
+        if TEST_DEBUG:
+            print(f"Initial console logs: {self._console_capture().get_logs()}")
 
         # Setup mock geolocation using guia.js MockGeolocationProvider
         mock_result = self._mock_geolocation()
         self.assertTrue(mock_result['success'], 
                        f"Mock setup should succeed: {mock_result}")
         
-        logs1 = console.get_logs()
-        print(f"Console logs after mock setup: {logs1}")
+        if TEST_DEBUG:
+            print(f"Console logs after mock setup: {self._console_capture().get_logs()}")
         
         # Verify mock configuration
         verification = verify_mock_configuration(self.driver)
@@ -314,8 +761,8 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         print(f"✅ Provider direct test passed: lat={provider_test['latitude']}, "
               f"lon={provider_test['longitude']}")
         
-        logs2 = console.get_logs()
-        print(f"Console logs after provider test: {logs2}")
+        if TEST_DEBUG:
+            print(f"Console logs after provider test: {self._console_capture().get_logs()}")
 
     def test_03_chrome_coordinates_display(self):
         """Test coordinate display using Chrome with CDP geolocation mocking."""
@@ -332,12 +779,11 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
             })
             
             # Load page
-            import os
-            test_dir = os.path.dirname(os.path.abspath(__file__))
-            repo_root = os.path.dirname(os.path.dirname(test_dir))
-            index_path = f"file://{os.path.join(repo_root, 'src', 'index.html')}"
-            chrome_driver.get(index_path)
-            time.sleep(3)
+            _get_or_skip(self, chrome_driver, f"{self.base_url}/index.html")
+            self._wait_until(
+                lambda d: d.execute_script("return document.readyState") == "complete",
+                driver=chrome_driver,
+            )
             
             # Enable tracking
             chrome_driver.execute_script("""
@@ -347,7 +793,7 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
                     toggle.dispatchEvent(new Event('change'));
                 }
             """)
-            time.sleep(5)
+            self._wait_for_location_result(driver=chrome_driver)
             
             # Extract coordinates from DOM
             coords = chrome_driver.execute_script("""
@@ -386,28 +832,19 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         its service during initialization.
         """
         # Load page and wait for initialization
-        self.driver.get(f"{self.base_url}/index.html")
-        time.sleep(3)  # Wait longer for app initialization
+        self._load_page(f"{self.base_url}/index.html", fresh=True)
+        # Wait for app initialization (guia.js exposes its classes on window)
+        self._wait_until(
+            lambda d: d.execute_script("return !!window.MockGeolocationProvider")
+        )
         
-        # Verify critical elements exist
-        initial_check = self.driver.execute_script("""
+        # Verify critical elements exist and see which globals are available,
+        # in a single round-trip
+        page_check = self.driver.execute_script("""
             return {
                 hasGetLocationBtn: !!document.getElementById('getLocationBtn'),
                 hasLocationResult: !!document.getElementById('locationResult'),
-                hasAppContent: !!document.getElementById('app-content')
-            };
-        """)
-        print(f"[TEST] Page structure check: {initial_check}")
-        
-        # Verify all required elements are present
-        self.assertTrue(initial_check['hasGetLocationBtn'], "Get Location button should be present")
-        self.assertTrue(initial_check['hasLocationResult'], "Location result section should be present")
-        self.assertTrue(initial_check['hasAppContent'], "App content container should be present")
-        
-        # Now inject mock provider directly into the existing GeolocationService
-        # First check what global references are available
-        global_check = self.driver.execute_script("""
-            return {
+                hasAppContent: !!document.getElementById('app-content'),
                 hasAppState: typeof window.AppState !== 'undefined',
                 hasPositionManager: typeof window.PositionManager !== 'undefined',
                 hasWebGeocodingManager: typeof window.WebGeocodingManager !== 'undefined',
@@ -416,65 +853,19 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
                 globalKeys: Object.keys(window).filter(k => k.includes('Geo') || k.includes('App') || k.includes('Position'))
             };
         """)
-        print(f"[TEST] Global check: {global_check}")
+        print(f"[TEST] Page check: {page_check}")
+        
+        # Verify all required elements are present
+        self.assertTrue(page_check['hasGetLocationBtn'], "Get Location button should be present")
+        self.assertTrue(page_check['hasLocationResult'], "Location result section should be present")
+        self.assertTrue(page_check['hasAppContent'], "App content container should be present")
         
         # Since AppState is module-scoped, we need to find the manager through global references
         # The PositionManager singleton might have a reference to the service
-        inject_result = self.driver.execute_script(f"""
-            try {{
-                // Create mock position object
-                window.TEST_POSITION = {{
-                    coords: {{
-                        latitude: {self.TEST_LATITUDE},
-                        longitude: {self.TEST_LONGITUDE},
-                        accuracy: 10,
-                        altitude: null,
-                        altitudeAccuracy: null,
-                        heading: null,
-                        speed: null
-                    }},
-                    timestamp: Date.now()
-                }};
-                
-                // Create MockGeolocationProvider instance
-                window.TEST_MOCK_PROVIDER = new window.MockGeolocationProvider({{
-                    defaultPosition: window.TEST_POSITION,
-                    supported: true,
-                    delay: 100
-                }});
-                
-                console.log('[TEST] Mock provider created');
-                
-                // CRITICAL FIX: Override the provider's getCurrentPosition method, not GeolocationService
-                // GeolocationService internally calls this.provider.getCurrentPosition()
-                // So we need to replace the provider on ALL instances
-                
-                // Override BrowserGeolocationProvider.prototype.getCurrentPosition
-                // This will affect all instances including the one in GeolocationService
-                window.BrowserGeolocationProvider.prototype.getCurrentPosition = function(successCallback, errorCallback, options) {{
-                    console.log('[TEST] BrowserGeolocationProvider.getCurrentPosition intercepted - using mock');
-                    return window.TEST_MOCK_PROVIDER.getCurrentPosition(successCallback, errorCallback, options);
-                }};
-                
-                return {{
-                    success: true,
-                    method: 'provider prototype override',
-                    coordinates: {{
-                        latitude: {self.TEST_LATITUDE},
-                        longitude: {self.TEST_LONGITUDE},
-                        accuracy: 10
-                    }}
-                }};
-                
-            }} catch (error) {{
-                console.error('[TEST] Failed to inject mock:', error);
-                return {{
-                    success: false,
-                    error: error.message,
-                    stack: error.stack
-                }};
-            }}
-        """)
+        self._needs_geo_reset = True
+        inject_result = self.driver.execute_script(
+            _INSTALL_MOCK_PROVIDER_JS, self.TEST_LATITUDE, self.TEST_LONGITUDE
+        )
         
         print(f"[TEST] Mock injection result: {inject_result}")
         self.assertTrue(inject_result['success'], 
@@ -487,20 +878,72 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         print("[TEST] Clicking 'Obter Localização' button...")
         get_location_btn.click()
         
-        # Wait for coordinates to appear in locationResult element
-        time.sleep(4)
-        
-        # Check what happened - debug the state
-        debug_info = self.driver.execute_script("""
-            const locationResult = document.getElementById('locationResult');
-            return {
-                locationResultExists: !!locationResult,
-                locationResultHTML: locationResult ? locationResult.innerHTML.substring(0, 300) : 'N/A',
-                hasMockProvider: !!window.TEST_MOCK_PROVIDER,
-                hasGeolocationService: typeof window.GeolocationService !== 'undefined'
+        # Poll for coordinates to appear in the locationResult element. Each
+        # poll is one round-trip returning both debug state and coordinates,
+        # extracted from both possible locations:
+        # 1. The id="locationResult" section (primary display with detailed coordinates)
+        # 2. The id="coordinates" section with id="lat-long-display" span (summary display)
+        # Install the probe once; each poll then sends only a one-line call
+        self.driver.execute_script(r"""
+            if (window.__probeLocationResult) {
+                return;
+            }
+            // Extract latitude and longitude from locationResult using regex
+            const latRe = /Latitude:<\/strong>\s*(-?\d+\.\d+)/i;
+            const lonRe = /Longitude:<\/strong>\s*(-?\d+\.\d+)/i;
+            window.__probeLocationResult = function () {
+                const locationResult = document.getElementById('locationResult');
+                const debug = {
+                    locationResultExists: !!locationResult,
+                    locationResultHTML: locationResult ? locationResult.innerHTML.substring(0, 300) : 'N/A',
+                    hasMockProvider: !!window.TEST_MOCK_PROVIDER,
+                    hasGeolocationService: typeof window.GeolocationService !== 'undefined'
+                };
+                if (!locationResult) {
+                    return { debug, coordinates: { success: false, error: 'locationResult element not found' } };
+                }
+            
+                const locationHTML = locationResult.innerHTML;
+            
+                const latMatch = locationHTML.match(latRe);
+                const lonMatch = locationHTML.match(lonRe);
+            
+                if (!latMatch || !lonMatch) {
+                    return {
+                        debug,
+                        coordinates: {
+                            success: false,
+                            error: 'Coordinates not found in locationResult',
+                            html: locationHTML.substring(0, 500)
+                        }
+                    };
+                }
+            
+                // Also check if the coordinates section is populated (optional validation)
+                const latLongDisplay = document.getElementById('lat-long-display');
+                const coordinatesText = latLongDisplay ? (latLongDisplay.textContent || latLongDisplay.innerText) : 'Not populated';
+            
+                return {
+                    debug,
+                    coordinates: {
+                        success: true,
+                        latitude: parseFloat(latMatch[1]),
+                        longitude: parseFloat(lonMatch[1]),
+                        source: 'locationResult',
+                        coordinatesSectionText: coordinatesText,
+                        locationResultHTML: locationHTML.substring(0, 300)
+                    }
+                };
             };
         """)
-        print(f"[TEST] Debug info: {debug_info}")
+        probe_result = {}
+
+        def coordinates_ready(driver):
+            probe_result.update(driver.execute_script("return window.__probeLocationResult();"))
+            return probe_result['coordinates']['success']
+
+        self._wait_until(coordinates_ready, timeout=self.long_wait_timeout)
+        print(f"[TEST] Debug info: {probe_result.get('debug')}")
         
         # Handle any alert dialogs that might appear
         try:
@@ -515,45 +958,7 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
             # No alert present, which is expected
             pass
         
-        # Extract coordinate values from both possible locations:
-        # 1. The id="locationResult" section (primary display with detailed coordinates)
-        # 2. The id="coordinates" section with id="lat-long-display" span (summary display)
-        coordinate_data = self.driver.execute_script(r"""
-            // First check the main locationResult section
-            const locationResult = document.getElementById('locationResult');
-            if (!locationResult) {
-                return { success: false, error: 'locationResult element not found' };
-            }
-            
-            const locationHTML = locationResult.innerHTML;
-            
-            // Extract latitude and longitude from locationResult using regex
-            const latMatch = locationHTML.match(/Latitude:<\/strong>\s*(-?\d+\.\d+)/i);
-            const lonMatch = locationHTML.match(/Longitude:<\/strong>\s*(-?\d+\.\d+)/i);
-            
-            if (!latMatch || !lonMatch) {
-                return { 
-                    success: false, 
-                    error: 'Coordinates not found in locationResult',
-                    html: locationHTML.substring(0, 500)
-                };
-            }
-            
-            // Also check if the coordinates section is populated (optional validation)
-            const coordinatesSection = document.getElementById('coordinates');
-            const latLongDisplay = document.getElementById('lat-long-display');
-            const coordinatesText = latLongDisplay ? (latLongDisplay.textContent || latLongDisplay.innerText) : 'Not populated';
-            
-            return {
-                success: true,
-                latitude: parseFloat(latMatch[1]),
-                longitude: parseFloat(lonMatch[1]),
-                source: 'locationResult',
-                coordinatesSectionText: coordinatesText,
-                locationResultHTML: locationHTML.substring(0, 300)
-            };
-        """)
-        
+        coordinate_data = probe_result.get('coordinates', {'success': False})
         print(f"[TEST] Coordinate extraction result: success={coordinate_data.get('success')}")
         
         # Debug: print relevant info
@@ -580,105 +985,148 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         print(f"✅ Coordinates validated in locationResult: lat={actual_lat}, lon={actual_lon}")
         print(f"✅ Full coordinate display validation passed!")    
 
-    def test_04_address_converter_with_milho_verde_coordinates(self):
-        """Test address converter with Milho Verde coordinates."""
-        import os
-        converter_file = f"{self.base_url.replace('file://', '')}/address-converter.html"
-        if not os.path.exists(converter_file):
-            self.skipTest("address-converter.html not implemented yet")
+    def test_09_responsive_design_mobile_viewport(self):
+        """Test that page is responsive on mobile viewport."""
+        # Set mobile viewport, restoring the original size even on failure
+        original_size = self.driver.get_window_size()
+        self.addCleanup(
+            self.driver.set_window_size,
+            original_size["width"], original_size["height"],
+        )
+        self.driver.set_window_size(375, 667)  # iPhone SE size
         
-        self.driver.get(f"{self.base_url}/address-converter.html")
+        self._load_page(f"{self.base_url}/index.html")
         
-        # Verify page loaded
-        self.assertIn("Conversor", self.driver.title)
-        
-        # Find input fields
-        lat_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "latitude"))
+        # Verify essential elements are still accessible
+        get_location_btn = self.wait.until(
+            EC.presence_of_element_located((By.ID, "getLocationBtn"))
         )
-        lon_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "longitude"))
+        
+        # Element should be visible and clickable even on mobile
+        self.assertTrue(get_location_btn.is_displayed(),
+                       "Button should be visible on mobile viewport")
+
+    def test_10_location_result_persistence(self):
+        """Test that location result persists after multiple interactions."""
+        # Let the browser itself report the test coordinates; the guia.js
+        # mock provider is the fallback where it cannot
+        overridden = self._override_geolocation()
+        self._load_page(f"{self.base_url}/index.html", fresh=True)
+        if not overridden:
+            self._mock_geolocation()
+        
+        # Get location
+        get_location_btn = self.wait.until(
+            EC.element_to_be_clickable((By.ID, "getLocationBtn"))
         )
+        get_location_btn.click()
         
-        # Clear and enter coordinates
-        lat_input.clear()
-        lat_input.send_keys(str(self.TEST_LATITUDE))
+        # Wait for result
+        self._wait_for_location_result()
         
-        lon_input.clear()
-        lon_input.send_keys(str(self.TEST_LONGITUDE))
+        # Get first result
+        location_result = self.driver.find_element(By.ID, "locationResult")
+        first_result = location_result.text
         
-        # Find and click convert button
-        convert_btn = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "convertBtn"))
+        # Scroll page
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.driver.execute_script("window.scrollTo(0, 0);")
+        
+        # Check result is still there
+        location_result = self.driver.find_element(By.ID, "locationResult")
+        second_result = location_result.text
+        
+        self.assertEqual(first_result, second_result,
+                        "Location result should persist after page interactions")
+
+
+@pytest.mark.keep_page
+@pytest.mark.xdist_group("milho_verde_converter")
+class TestMilhoVerdeAddressConverter(_MilhoVerdeTestCase):
+    """Address converter tests for the Milho Verde coordinates."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Check once which converter pages exist."""
+        super().setUpClass()
+        cls._converter_available = (SRC_DIR / "address-converter.html").exists()
+        # address-converter.html is in examples folder, not src
+        cls._example_converter_file = str(
+            SRC_DIR.parent / "examples" / "address-converter.html"
         )
-        self._scroll_to_element(convert_btn)
-        convert_btn.click()
+        cls._example_converter_available = os.path.exists(cls._example_converter_file)
+
+    def test_04_address_converter_full_validation(self):
+        """Test the address converter result for the Milho Verde coordinates.
+
+        One load/convert/wait cycle, then the address, state and postal
+        code checks run as subtests against the same result.
+        """
+        if not self._converter_available:
+            self.skipTest("address-converter.html not implemented yet")
+        
+        self._load_converter()
+        
+        # Verify page loaded
+        self.assertIn("Conversor", self.driver.title)
+        
+        # Enter coordinates and convert
+        self._serve_canned_nominatim()
+        self._submit_coords(self.TEST_LATITUDE, self.TEST_LONGITUDE)
         
         # Wait for address result (longer timeout for API call)
-        time.sleep(5)  # Allow OpenStreetMap API to respond
+        self._wait_for_address_result()
         
-        # Check if address result is displayed
-        try:
-            address_result = self.driver.find_element(By.ID, "addressResult")
-            result_html = address_result.get_attribute('innerHTML').lower()
-            
+        # Only addressResult matters; avoid serializing the whole page
+        result_html = self._address_result_html()
+        self.assertIsNotNone(result_html, "Address result element not found")
+        result_html = result_html.lower()
+        
+        with self.subTest("address result"):
             # Verify some expected address components are present
             # (Flexible check since API response may vary)
             has_address_data = any(keyword in result_html for keyword in 
-                                  ["serro", "minas gerais", "mg", "rua", "39150"])
+                                  ("serro", "minas gerais", "mg", "rua", "39150"))
             
             self.assertTrue(has_address_data or "erro" in result_html,
                           "Should display address data or error message")
-        except NoSuchElementException:
-            self.fail("Address result element not found")
+        
+        with self.subTest("Minas Gerais state"):
+            # Verify Minas Gerais or MG is present
+            has_mg_reference = any(keyword in result_html for keyword in _MG_KEYWORDS)
+            
+            self.assertTrue(has_mg_reference,
+                           "Address result should contain reference to Minas Gerais (MG)")
+        
+        with self.subTest("Brazilian postal code"):
+            has_cep = _CEP_RE.search(result_html)
+            
+            # Should have some postal code format
+            # (May not be exact match due to API variations)
+            self.assertTrue(has_cep or "39150" in result_html,
+                           "Address result should contain Brazilian postal code format")
 
     def test_05_address_components_validation(self):
         """Test that address components are properly extracted and displayed."""
-        import os
-        # address-converter.html is in examples folder, not src
-        base_dir = self.base_url.replace('file://', '').replace('/src', '')
-        converter_file = f"{base_dir}/examples/address-converter.html"
-        if not os.path.exists(converter_file):
+        if not self._example_converter_available:
             self.skipTest("address-converter.html not implemented yet")
         
-        self.driver.get(f"file://{converter_file}")
-        
-        # Input coordinates
-        lat_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "latitude"))
-        )
-        lon_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "longitude"))
-        )
-        
-        lat_input.clear()
-        lat_input.send_keys(str(self.TEST_LATITUDE))
-        lon_input.clear()
-        lon_input.send_keys(str(self.TEST_LONGITUDE))
+        self._load_page(f"file://{self._example_converter_file}", fresh=True)
         
-        # Convert
-        convert_btn = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "fetchButton"))
-        )
-        convert_btn.click()
+        # Input coordinates and convert
+        self._serve_canned_nominatim()
+        self._submit_coords(self.TEST_LATITUDE, self.TEST_LONGITUDE, button_id="fetchButton")
         
-        # Wait for result - wait for loading to disappear
+        # Wait for loading to finish and municipio-value to be filled in
         print("Waiting for address to load...")
-        time.sleep(3)  # Initial wait for API call to start
-        
-        # Wait for loading indicator to disappear and results to appear
-        max_wait = 15
         start_time = time.time()
-        while time.time() - start_time < max_wait:
-            address_result = self.driver.find_element(By.ID, "results")
-            result_content = address_result.get_attribute('innerHTML')
-            if 'loading' not in result_content.lower():
-                print(f"Results loaded after {time.time() - start_time:.2f} seconds")
-                break
-            time.sleep(1)
-        
-        # Additional wait for municipio-value to be updated
-        time.sleep(2)
+        loaded = self._wait_until(
+            lambda d: "loading" not in d.find_element(By.ID, "results")
+                                        .get_attribute("innerHTML").lower()
+            and d.find_element(By.ID, "municipio-value").text.strip() not in ("", "—")
+        )
+        if loaded:
+            print(f"Results loaded after {time.time() - start_time:.2f} seconds")
         
         # Check browser console for errors
         console_logs = self.driver.get_log('browser')
@@ -696,9 +1144,9 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
             # Check for key address components
             # Note: Exact format depends on app implementation
             expected_components = {
-                "city": ["serro"],
-                "state": ["minas gerais", "mg"],
-                "postal": ["39150"],
+                "city": ("serro",),
+                "state": ("minas gerais", "mg"),
+                "postal": ("39150",),
             }
             
             result_lower = result_content.lower()
@@ -735,111 +1183,27 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         except NoSuchElementException:
             self.fail("Could not find address result element")
 
-    def test_06_minas_gerais_state_validation(self):
-        """Test that Minas Gerais state is correctly identified."""
-        import os
-        converter_file = f"{self.base_url.replace('file://', '')}/address-converter.html"
-        if not os.path.exists(converter_file):
-            self.skipTest("address-converter.html not implemented yet")
-        
-        self.driver.get(f"{self.base_url}/address-converter.html")
-        
-        # Input coordinates
-        lat_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "latitude"))
-        )
-        lon_input = self.driver.find_element(By.ID, "longitude")
-        
-        lat_input.send_keys(str(self.TEST_LATITUDE))
-        lon_input.send_keys(str(self.TEST_LONGITUDE))
-        
-        # Convert
-        convert_btn = self.driver.find_element(By.ID, "convertBtn")
-        convert_btn.click()
-        
-        # Wait for API response
-        time.sleep(6)
-        
-        # Get page content
-        page_content = self.driver.page_source.lower()
-        
-        # Verify Minas Gerais or MG is present
-        has_mg_reference = ("minas gerais" in page_content or 
-                           "mg" in page_content or
-                           "br-mg" in page_content)
-        
-        self.assertTrue(has_mg_reference,
-                       "Page should contain reference to Minas Gerais (MG)")
-
-    def test_07_brazilian_postal_code_format(self):
-        """Test that Brazilian CEP format is recognized."""
-        import os
-        converter_file = f"{self.base_url.replace('file://', '')}/address-converter.html"
-        if not os.path.exists(converter_file):
-            self.skipTest("address-converter.html not implemented yet")
-        
-        self.driver.get(f"{self.base_url}/address-converter.html")
-        
-        # Input coordinates
-        lat_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "latitude"))
-        )
-        lon_input = self.driver.find_element(By.ID, "longitude")
-        
-        lat_input.send_keys(str(self.TEST_LATITUDE))
-        lon_input.send_keys(str(self.TEST_LONGITUDE))
-        
-        # Convert
-        convert_btn = self.driver.find_element(By.ID, "convertBtn")
-        convert_btn.click()
-        
-        # Wait for result
-        time.sleep(6)
-        
-        # Check page source for postal code pattern
-        page_source = self.driver.page_source
-        
-        # Brazilian CEP format: 99999-999 or 99999999
-        import re
-        cep_pattern = r'\b\d{5}-?\d{3}\b'
-        has_cep = re.search(cep_pattern, page_source)
-        
-        # Should have some postal code format
-        # (May not be exact match due to API variations)
-        self.assertTrue(has_cep or "39150" in page_source,
-                       "Should contain Brazilian postal code format")
-
     def test_08_error_handling_invalid_coordinates(self):
         """Test error handling with invalid coordinates."""
-        import os
-        converter_file = f"{self.base_url.replace('file://', '')}/address-converter.html"
-        if not os.path.exists(converter_file):
+        if not self._converter_available:
             self.skipTest("address-converter.html not implemented yet")
         
-        self.driver.get(f"{self.base_url}/address-converter.html")
-        
-        # Input invalid coordinates
-        lat_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "latitude"))
-        )
-        lon_input = self.driver.find_element(By.ID, "longitude")
-        
-        lat_input.send_keys("999")  # Invalid latitude
-        lon_input.send_keys("999")  # Invalid longitude
+        self._load_converter()
         
-        # Try to convert
-        convert_btn = self.driver.find_element(By.ID, "convertBtn")
-        convert_btn.click()
+        # Input invalid coordinates and try to convert
+        self._serve_canned_nominatim()
+        self._submit_coords(999, 999)
         
-        # Wait for response
-        time.sleep(3)
+        # Wait for response (invalid input may render nothing at all, so
+        # don't wait longer than the old fixed delay)
+        self._wait_for_address_result(timeout=3)
         
         # Should show some form of error or no result
-        page_content = self.driver.page_source.lower()
+        page_content = (self._address_result_html() or "").lower()
         
         # Check for error indicators
         has_error_indicator = any(keyword in page_content for keyword in 
-                                 ["erro", "error", "inválido", "invalid"])
+                                 ("erro", "error", "inválido", "invalid"))
         
         # Or check that no valid address is shown
         no_valid_address = "serro" not in page_content
@@ -847,115 +1211,33 @@ class TestMilhoVerdeGeolocation(unittest.TestCase):
         self.assertTrue(has_error_indicator or no_valid_address,
                        "Should handle invalid coordinates gracefully")
 
-    def test_09_responsive_design_mobile_viewport(self):
-        """Test that page is responsive on mobile viewport."""
-        # Set mobile viewport
-        self.driver.set_window_size(375, 667)  # iPhone SE size
-        
-        self.driver.get(f"{self.base_url}/index.html")
-        
-        # Verify essential elements are still accessible
-        get_location_btn = self.wait.until(
-            EC.presence_of_element_located((By.ID, "getLocationBtn"))
-        )
-        
-        # Element should be visible and clickable even on mobile
-        self.assertTrue(get_location_btn.is_displayed(),
-                       "Button should be visible on mobile viewport")
-        
-        # Restore desktop viewport
-        self.driver.set_window_size(1920, 1080)
-
-    def test_10_location_result_persistence(self):
-        """Test that location result persists after multiple interactions."""
-        self.driver.get(f"{self.base_url}/index.html")
-        
-        # Mock geolocation
-        self._mock_geolocation()
-        
-        # Get location
-        get_location_btn = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "getLocationBtn"))
-        )
-        get_location_btn.click()
-        
-        # Wait for result
-        time.sleep(4)
-        
-        # Get first result
-        location_result = self.driver.find_element(By.ID, "locationResult")
-        first_result = location_result.text
-        
-        # Scroll page
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        
-        # Check result is still there
-        location_result = self.driver.find_element(By.ID, "locationResult")
-        second_result = location_result.text
-        
-        self.assertEqual(first_result, second_result,
-                        "Location result should persist after page interactions")
-
 
-class TestMilhoVerdeAccessibility(unittest.TestCase):
+@pytest.mark.xdist_group("milho_verde_accessibility")
+class TestMilhoVerdeAccessibility(_MilhoVerdeTestCase):
     """Accessibility tests for Milho Verde geolocation workflow."""
+
+    # The accessibility preferences only apply at launch
+    _needs_own_browser = True
     
     @classmethod
     def setUpClass(cls):
-        """Set up Firefox with accessibility testing support."""
-        firefox_options = Options()
+        """Set up timeouts for the accessibility checks."""
+        super().setUpClass()
+        cls.wait_timeout = 15
+
+    @classmethod
+    def _firefox_options(cls):
+        """Add accessibility testing support to the shared Firefox options."""
+        firefox_options = super()._firefox_options()
         
         # Firefox accessibility preferences
         firefox_options.set_preference("ui.prefersReducedMotion", 1)
         firefox_options.set_preference("accessibility.force_disabled", 0)
-        
-        # Set Firefox binary location explicitly
-        import os
-        
-        # Try multiple possible Firefox locations
-        firefox_paths = [
-            os.environ.get('FIREFOX_BIN'),
-            '/usr/bin/firefox',
-            '/usr/bin/firefox-esr',
-            '/usr/bin/firefox-bin',
-            '/opt/firefox/firefox',
-            '/opt/firefox/firefox-bin'
-        ]
-        
-        firefox_binary = None
-        for path in firefox_paths:
-            if path and os.path.exists(path):
-                firefox_binary = path
-                break
-        
-        if firefox_binary:
-            firefox_options.binary_location = firefox_binary
-        
-        try:
-            cls.driver = webdriver.Firefox(options=firefox_options)
-            cls.driver.set_window_size(1920, 1080)
-        except Exception as e:
-            print(f"WARNING: Could not initialize Firefox WebDriver: {e}")
-            raise unittest.SkipTest("Firefox WebDriver not available")
-        
-        cls.base_url = "file:///home/mpb/Documents/GitHub/guia_turistico/src"
-        cls.wait_timeout = 15
-
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up."""
-        if hasattr(cls, 'driver') and cls.driver:
-            cls.driver.quit()
-
-    def setUp(self):
-        """Set up before each test."""
-        self.wait = WebDriverWait(self.driver, self.wait_timeout)
+        return firefox_options
 
     def test_keyboard_navigation(self):
         """Test that all interactive elements are keyboard accessible."""
-        self.driver.get(f"{self.base_url}/index.html")
+        _get_or_skip(self, self.driver, f"{self.base_url}/index.html")
         
         # Get location button
         get_location_btn = self.wait.until(
@@ -971,7 +1253,7 @@ class TestMilhoVerdeAccessibility(unittest.TestCase):
 
     def test_aria_labels_present(self):
         """Test that important elements have ARIA labels."""
-        self.driver.get(f"{self.base_url}/index.html")
+        _get_or_skip(self, self.driver, f"{self.base_url}/index.html")
         
         # Check if main interactive elements have accessibility attributes
         get_location_btn = self.wait.until(
@@ -13,411 +13,439 @@ Test Coverage:
 - Location cards have more visual prominence (color, elevation)
 - Responsive behavior on different screen sizes
 - Hover states work correctly
-- Accessibility features are present
+
+The cards' markup and ARIA attributes need no browser and are checked under
+jsdom in __tests__/components/LocationHighlightCards.vue.test.ts.
 """
 
-import unittest
-import time
-from selenium import webdriver
+import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+DESKTOP_VIEWPORT = (1920, 1080)  # Launch size of the session browsers
+MOBILE_VIEWPORT = (375, 667)  # iPhone SE size
+TABLET_VIEWPORT = (768, 1024)  # iPad size
+
+# The tests only read the page, so the page fixture keeps it loaded between
+# tests instead of conftest's reset sending the browser to about:blank
+pytestmark = pytest.mark.keep_page
+
+# Soft reset between tests; returns false if the browser has left the page
+# and it must be loaded again
+_RESET_HOME_PAGE_JS = """
+if (location.href !== arguments[0]) {
+    return false;
+}
+window.scrollTo(0, 0);
+return true;
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _explicit_waits_only(driver):
+    """Explicit waits only: an implicit wait makes every failed lookup block"""
+    driver.implicitly_wait(0)
+
+
+@pytest.fixture(scope="module")
+def _window_size(driver):
+    """
+    Current window size, so a test only resizes when its viewport differs
+    from the previous test's. The desktop size other modules expect is
+    restored once this module's tests are done.
+    """
+    state = {"size": DESKTOP_VIEWPORT}
+    yield state
+    if state["size"] != DESKTOP_VIEWPORT:
+        driver.set_window_size(*DESKTOP_VIEWPORT)
+
+
+@pytest.fixture
+def viewport(request, driver, _window_size):
+    """Window size for the test; parametrize indirectly to change it"""
+    size = getattr(request, "param", DESKTOP_VIEWPORT)
+    if _window_size["size"] != size:
+        driver.set_window_size(*size)
+        _window_size["size"] = size
+    return size
+
+
+def _load_home_page(driver, url):
+    """Navigate to the home page and wait for the app to render the cards"""
+    driver.get(url)
+    # The cards are rendered by the app; wait for them once here so the
+    # tests can look elements up directly
+    _wait_until(driver, EC.presence_of_element_located((By.CLASS_NAME, "location-highlights")))
+
+
+@pytest.fixture(scope="module")
+def _home_page_url(driver, base_url):
+    """Load the home page once for the module; leave it when the module is done"""
+    url = f"{base_url}/index.html"
+    _load_home_page(driver, url)
+    yield url
+    driver.get("about:blank")
+
+
+@pytest.fixture
+def page(request, driver, _home_page_url, viewport):
+    """
+    Home page at the test's viewport, with the location cards rendered.
+
+    The page loaded by _home_page_url is reused and only scrolled back to
+    the top; it is loaded again for ``fresh_page`` tests or if the browser
+    has navigated away.
+    """
+    if request.node.get_closest_marker("fresh_page") or not driver.execute_script(
+        _RESET_HOME_PAGE_JS, _home_page_url
+    ):
+        _load_home_page(driver, _home_page_url)
+    return driver
+
+
+def _parent(driver, element_id):
+    """Card (parent element) of the element with element_id"""
+    parent = driver.execute_script(
+        "const el = document.getElementById(arguments[0]);"
+        "return el ? el.parentElement : null;",
+        element_id
+    )
+    if parent is None:
+        raise NoSuchElementException(f"No element with id '{element_id}'")
+    return parent
+
+
+def _css_batch(driver, element, *properties):
+    """Read several computed CSS properties of element in one round-trip"""
+    return driver.execute_script(
+        "const style = getComputedStyle(arguments[0]);"
+        "const result = {};"
+        "for (const name of Array.prototype.slice.call(arguments, 1)) {"
+        "  result[name] = style.getPropertyValue(name);"
+        "}"
+        "return result;",
+        element, *properties
+    )
+
+
+def _wait_until(driver, condition, timeout=10):
+    """Wait for a condition instead of sleeping; returns None on timeout"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.05).until(condition)
+    except TimeoutException:
+        return None
+
+
+def test_01_location_cards_exist(page):
+    """Test that location highlight cards are present"""
+    try:
+        # Wait for location highlights section to load
+        location_section = WebDriverWait(page, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "location-highlights"))
+        )
+        assert location_section is not None
+        
+        # Check for município card
+        municipio_card = page.find_element(By.ID, "municipio-value")
+        assert municipio_card is not None
+        
+        # Check for bairro card
+        bairro_card = page.find_element(By.ID, "bairro-value")
+        assert bairro_card is not None
+        
+        print("✓ Location cards exist")
+    except (TimeoutException, NoSuchElementException) as e:
+        pytest.fail(f"Location cards not found: {e}")
+
+
+def test_02_location_cards_larger_than_buttons(page):
+    """Test that location cards are visually larger than action buttons"""
+    try:
+        # Get location card dimensions
+        municipio_card = _parent(page, "municipio-value")
+        card_size = municipio_card.size
+        card_height = card_size['height']
+        
+        # Get button dimensions
+        restaurant_btn = page.find_element(By.ID, "findRestaurantsBtn")
+        button_size = restaurant_btn.size
+        button_height = button_size['height']
+        
+        # Location card should be significantly larger than button
+        assert card_height > button_height, (
+            f"Location card height ({card_height}px) should be greater than button height ({button_height}px)"
+        )
+        
+        # Cards should be at least 2x taller than buttons
+        assert card_height / button_height >= 2.0, (
+            f"Location cards should be at least 2x taller than buttons (ratio: {card_height/button_height:.2f})"
+        )
+        
+        print(f"✓ Location cards ({card_height}px) are larger than buttons ({button_height}px)")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Size comparison failed: {e}")
+
+
+def test_03_location_cards_prominent_styling(page):
+    """Test that location cards have prominent visual styling"""
+    try:
+        municipio_card = _parent(page, "municipio-value")
+        
+        styles = _css_batch(page, 
+            municipio_card, "background-color", "color", "box-shadow", "border-radius"
+        )
+        
+        # Check background color (should be blue gradient)
+        bg_color = styles["background-color"]
+        # RGB for primary blue should be present
+        assert "rgb" in bg_color.lower()
+        
+        # Check text color (should be white)
+        text_color = styles["color"]
+        # White text: rgb(255, 255, 255) or close to it
+        assert "255" in text_color
+        
+        # Check box-shadow (should have elevation)
+        box_shadow = styles["box-shadow"]
+        assert box_shadow != "none"
+        
+        # Check border-radius (should be rounded)
+        border_radius = styles["border-radius"]
+        assert border_radius != "0px"
+        
+        print("✓ Location cards have prominent styling (gradient, elevation, rounded)")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Prominent styling check failed: {e}")
+
 
-class TestVisualHierarchy(unittest.TestCase):
-    """Test visual hierarchy of location information vs action buttons"""
-    
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures that are shared across all tests"""
-        # Try Chrome first, fall back to Firefox
-        try:
-            options = webdriver.ChromeOptions()
-            options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            cls.driver = webdriver.Chrome(options=options)
-        except Exception as chrome_error:
-            print(f"Chrome not available, trying Firefox: {chrome_error}")
-            try:
-                options = webdriver.FirefoxOptions()
-                options.add_argument('--headless')
-                cls.driver = webdriver.Firefox(options=options)
-            except Exception as firefox_error:
-                raise Exception(f"No browser available. Chrome: {chrome_error}, Firefox: {firefox_error}")
-        
-        cls.driver.implicitly_wait(10)
-        cls.base_url = "http://localhost:8080"
-        cls.wait = WebDriverWait(cls.driver, 10)
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up after all tests"""
-        cls.driver.quit()
-    
-    def setUp(self):
-        """Set up before each test"""
-        self.driver.get(self.base_url)
-        time.sleep(1)  # Allow initial page load
-    
-    def test_01_location_cards_exist(self):
-        """Test that location highlight cards are present"""
-        try:
-            # Wait for location highlights section to load
-            location_section = self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "location-highlights"))
-            )
-            self.assertIsNotNone(location_section)
-            
-            # Check for município card
-            municipio_card = self.driver.find_element(By.ID, "municipio-value")
-            self.assertIsNotNone(municipio_card)
-            
-            # Check for bairro card
-            bairro_card = self.driver.find_element(By.ID, "bairro-value")
-            self.assertIsNotNone(bairro_card)
-            
-            print("✓ Location cards exist")
-        except (TimeoutException, NoSuchElementException) as e:
-            self.fail(f"Location cards not found: {e}")
-    
-    def test_02_location_cards_larger_than_buttons(self):
-        """Test that location cards are visually larger than action buttons"""
-        try:
-            # Get location card dimensions
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            card_size = municipio_card.size
-            card_height = card_size['height']
-            
-            # Get button dimensions
-            restaurant_btn = self.driver.find_element(By.ID, "findRestaurantsBtn")
-            button_size = restaurant_btn.size
-            button_height = button_size['height']
-            
-            # Location card should be significantly larger than button
-            self.assertGreater(
-                card_height, 
-                button_height,
-                f"Location card height ({card_height}px) should be greater than button height ({button_height}px)"
-            )
-            
-            # Cards should be at least 2x taller than buttons
-            self.assertGreaterEqual(
-                card_height / button_height,
-                2.0,
-                f"Location cards should be at least 2x taller than buttons (ratio: {card_height/button_height:.2f})"
-            )
-            
-            print(f"✓ Location cards ({card_height}px) are larger than buttons ({button_height}px)")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Size comparison failed: {e}")
-    
-    def test_03_location_cards_prominent_styling(self):
-        """Test that location cards have prominent visual styling"""
-        try:
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            
-            # Check background color (should be blue gradient)
-            bg_color = municipio_card.value_of_css_property("background-color")
-            # RGB for primary blue should be present
-            self.assertIn("rgb", bg_color.lower())
-            
-            # Check text color (should be white)
-            text_color = municipio_card.value_of_css_property("color")
-            # White text: rgb(255, 255, 255) or close to it
-            self.assertIn("255", text_color)
-            
-            # Check box-shadow (should have elevation)
-            box_shadow = municipio_card.value_of_css_property("box-shadow")
-            self.assertNotEqual(box_shadow, "none")
-            
-            # Check border-radius (should be rounded)
-            border_radius = municipio_card.value_of_css_property("border-radius")
-            self.assertNotEqual(border_radius, "0px")
-            
-            print("✓ Location cards have prominent styling (gradient, elevation, rounded)")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Prominent styling check failed: {e}")
-    
-    def test_04_buttons_de_emphasized_styling(self):
-        """Test that action buttons have de-emphasized styling"""
-        try:
-            restaurant_btn = self.driver.find_element(By.ID, "findRestaurantsBtn")
-            
-            # Check background color (should NOT be primary blue)
-            bg_color = restaurant_btn.value_of_css_property("background-color")
-            
-            # Should be gray-ish, not blue
-            # Parse RGB values
-            if "rgba" in bg_color or "rgb" in bg_color:
-                # Extract RGB values
-                import re
-                rgb_values = re.findall(r'\d+', bg_color)
-                if len(rgb_values) >= 3:
-                    r, g, b = int(rgb_values[0]), int(rgb_values[1]), int(rgb_values[2])
-                    
-                    # Gray colors have similar R, G, B values
-                    # Blue colors have low R, low G, high B
-                    # Check that it's not strongly blue
-                    self.assertFalse(
-                        (b > r + 50 and b > g + 50),
-                        f"Button should not be blue (RGB: {r}, {g}, {b})"
-                    )
-            
-            # Check box-shadow (should be none or minimal)
-            box_shadow = restaurant_btn.value_of_css_property("box-shadow")
-            # Should be "none" or very subtle
-            is_subtle = box_shadow == "none" or "0px 0px" in box_shadow
-            self.assertTrue(is_subtle, f"Button shadow should be subtle: {box_shadow}")
-            
-            print("✓ Buttons have de-emphasized styling (gray, minimal shadow)")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Button styling check failed: {e}")
-    
-    def test_05_location_card_labels(self):
-        """Test that location card labels are properly styled"""
-        try:
-            # Check município label
-            municipio_label = self.driver.find_element(By.ID, "municipio-label")
-            label_text = municipio_label.text
-            
-            # Label should be uppercase or have letter-spacing
-            font_size = municipio_label.value_of_css_property("font-size")
-            text_transform = municipio_label.value_of_css_property("text-transform")
-            
-            # Should be small and uppercase
-            self.assertIn("uppercase", text_transform.lower())
-            
-            # Font size should be smaller than value
-            municipio_value = self.driver.find_element(By.ID, "municipio-value")
-            value_font_size = municipio_value.value_of_css_property("font-size")
-            
-            # Convert to numbers for comparison
-            label_size = float(font_size.replace("px", ""))
-            value_size = float(value_font_size.replace("px", ""))
-            
-            self.assertLess(
-                label_size,
-                value_size,
-                f"Label ({label_size}px) should be smaller than value ({value_size}px)"
-            )
-            
-            print(f"✓ Labels properly styled (uppercase, {label_size}px vs value {value_size}px)")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Label styling check failed: {e}")
-    
-    def test_06_responsive_mobile_layout(self):
-        """Test visual hierarchy on mobile viewport"""
-        try:
-            # Set mobile viewport
-            self.driver.set_window_size(375, 667)  # iPhone SE size
-            time.sleep(0.5)
-            
-            # Location cards should still be present and prominent
-            location_section = self.driver.find_element(By.CLASS_NAME, "location-highlights")
-            self.assertIsNotNone(location_section)
-            
-            # Cards should stack vertically (single column)
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            bairro_card = self.driver.find_element(
-                By.XPATH, "//div[@id='bairro-value']/.."
-            )
-            
-            municipio_pos = municipio_card.location
-            bairro_pos = bairro_card.location
-            
-            # Bairro should be below município (higher Y coordinate)
-            self.assertGreater(
-                bairro_pos['y'],
-                municipio_pos['y'],
-                "Cards should stack vertically on mobile"
-            )
-            
-            # Cards should still be larger than buttons
-            card_height = municipio_card.size['height']
-            restaurant_btn = self.driver.find_element(By.ID, "findRestaurantsBtn")
-            button_height = restaurant_btn.size['height']
-            
-            self.assertGreater(card_height, button_height)
-            
-            print("✓ Mobile layout maintains visual hierarchy")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Mobile layout check failed: {e}")
-        finally:
-            # Reset to desktop size
-            self.driver.set_window_size(1280, 800)
-    
-    def test_07_responsive_tablet_layout(self):
-        """Test visual hierarchy on tablet viewport"""
-        try:
-            # Set tablet viewport
-            self.driver.set_window_size(768, 1024)  # iPad size
-            time.sleep(0.5)
-            
-            # Location cards should be side by side or responsive
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            bairro_card = self.driver.find_element(
-                By.XPATH, "//div[@id='bairro-value']/.."
-            )
-            
-            # Both should be visible
-            self.assertTrue(municipio_card.is_displayed())
-            self.assertTrue(bairro_card.is_displayed())
-            
-            print("✓ Tablet layout maintains visual hierarchy")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Tablet layout check failed: {e}")
-        finally:
-            # Reset to desktop size
-            self.driver.set_window_size(1280, 800)
-    
-    def test_08_hover_state_cards(self):
-        """Test hover state on location cards"""
-        try:
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            
-            # Get initial box-shadow
-            initial_shadow = municipio_card.value_of_css_property("box-shadow")
-            
-            # Hover over card
-            actions = ActionChains(self.driver)
-            actions.move_to_element(municipio_card).perform()
-            time.sleep(0.3)  # Wait for transition
-            
-            # Get hover box-shadow
-            hover_shadow = municipio_card.value_of_css_property("box-shadow")
-            
-            # Shadow should change on hover (increased elevation)
-            # Note: In headless mode, hover may not trigger, so this is a soft check
-            # We just verify that hover styles are defined
-            print(f"✓ Hover states defined (initial: {initial_shadow[:50]}...)")
-        except (NoSuchElementException, Exception) as e:
-            # Hover may not work in headless mode, so we make this a warning
-            print(f"⚠ Hover state check skipped (headless mode): {e}")
-    
-    def test_09_accessibility_aria_labels(self):
-        """Test accessibility features on location cards"""
-        try:
-            # Check section has ARIA label
-            location_section = self.driver.find_element(By.CLASS_NAME, "location-highlights")
-            aria_label = location_section.get_attribute("aria-label")
-            self.assertIsNotNone(aria_label)
-            self.assertIn("localização", aria_label.lower())
-            
-            # Check cards have roles
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            role = municipio_card.get_attribute("role")
-            self.assertEqual(role, "region")
-            
-            # Check values have aria-live
-            municipio_value = self.driver.find_element(By.ID, "municipio-value")
-            aria_live = municipio_value.get_attribute("aria-live")
-            self.assertEqual(aria_live, "polite")
-            
-            print("✓ Accessibility features present (ARIA labels, roles, live regions)")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Accessibility check failed: {e}")
-    
-    def test_10_css_file_loaded(self):
-        """Test that location-highlights.css is loaded"""
-        try:
-            # Check if CSS file is in the DOM
-            stylesheets = self.driver.find_elements(By.TAG_NAME, "link")
-            
-            css_loaded = False
-            for stylesheet in stylesheets:
-                href = stylesheet.get_attribute("href")
-                if href and "location-highlights.css" in href:
-                    css_loaded = True
-                    break
-            
-            self.assertTrue(
-                css_loaded,
-                "location-highlights.css should be loaded in the page"
-            )
-            
-            print("✓ location-highlights.css is loaded")
-        except AssertionError as e:
-            self.fail(f"CSS file check failed: {e}")
-    
-    def test_11_visual_hierarchy_order(self):
-        """Test that elements appear in correct visual order"""
-        try:
-            # Get Y positions of key elements
-            location_section = self.driver.find_element(By.CLASS_NAME, "location-highlights")
-            buttons_nav = self.driver.find_element(By.XPATH, "//nav[@aria-label='Ações da página']")
-            
-            location_y = location_section.location['y']
-            buttons_y = buttons_nav.location['y']
-            
-            # Buttons should come BEFORE location cards in the current layout
-            # (but location cards should be MORE visually prominent despite position)
-            # This test just ensures both elements exist and are positioned
-            
-            self.assertIsNotNone(location_y)
-            self.assertIsNotNone(buttons_y)
-            
-            print(f"✓ Visual hierarchy established (cards at y={location_y}, buttons at y={buttons_y})")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Visual order check failed: {e}")
-    
-    def test_12_contrast_ratio_sufficient(self):
-        """Test that text contrast on cards is sufficient"""
-        try:
-            municipio_card = self.driver.find_element(
-                By.XPATH, "//div[@id='municipio-value']/.."
-            )
-            
-            # Get background and text colors
-            bg_color = municipio_card.value_of_css_property("background-color")
-            text_color = municipio_card.value_of_css_property("color")
-            
-            # Check that text is white or very light
-            if "rgb" in text_color.lower():
-                import re
-                rgb_values = re.findall(r'\d+', text_color)
-                if len(rgb_values) >= 3:
-                    r, g, b = int(rgb_values[0]), int(rgb_values[1]), int(rgb_values[2])
-                    
-                    # All values should be high (white)
-                    self.assertGreater(r, 200, "Text should be white or very light")
-                    self.assertGreater(g, 200, "Text should be white or very light")
-                    self.assertGreater(b, 200, "Text should be white or very light")
-            
-            print(f"✓ Text contrast sufficient (bg: {bg_color}, text: {text_color})")
-        except (NoSuchElementException, AssertionError) as e:
-            self.fail(f"Contrast check failed: {e}")
-
-
-def run_tests():
-    """Run the test suite"""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestVisualHierarchy)
-    
-    # Run tests with verbosity
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Return exit code
-    return 0 if result.wasSuccessful() else 1
-
-
-if __name__ == "__main__":
-    import sys
-    sys.exit(run_tests())
+def test_04_buttons_de_emphasized_styling(page):
+    """Test that action buttons have de-emphasized styling"""
+    try:
+        restaurant_btn = page.find_element(By.ID, "findRestaurantsBtn")
+        
+        # Evaluate the color and shadow checks in the browser, one round-trip
+        result = page.execute_script("""
+            const style = getComputedStyle(arguments[0]);
+            const background = style.getPropertyValue('background-color');
+            const boxShadow = style.getPropertyValue('box-shadow');
+            const [r, g, b] = (background.match(/\\d+/g) || []).map(Number);
+            return {
+                background: background,
+                boxShadow: boxShadow,
+                // Gray colors have similar R, G, B values; blue has low R, low G, high B
+                notBlue: !background.includes('rgb') || b === undefined
+                    || !(b > r + 50 && b > g + 50),
+                // Should be "none" or very subtle
+                subtleShadow: boxShadow === 'none' || boxShadow.includes('0px 0px')
+            };
+        """, restaurant_btn)
+        
+        # Check background color (should NOT be primary blue)
+        assert result["notBlue"], f"Button should not be blue ({result['background']})"
+        
+        # Check box-shadow (should be none or minimal)
+        assert result["subtleShadow"], f"Button shadow should be subtle: {result['boxShadow']}"
+        
+        print("✓ Buttons have de-emphasized styling (gray, minimal shadow)")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Button styling check failed: {e}")
+
+
+def test_05_location_card_labels(page):
+    """Test that location card labels are properly styled"""
+    try:
+        # Check município label and value styles in one round-trip
+        styles = page.execute_script("""
+            const label = document.getElementById('municipio-label');
+            const value = document.getElementById('municipio-value');
+            if (!label || !value) {
+                return null;
+            }
+            const labelStyle = getComputedStyle(label);
+            return {
+                fontSize: labelStyle.getPropertyValue('font-size'),
+                textTransform: labelStyle.getPropertyValue('text-transform'),
+                valueFontSize: getComputedStyle(value).getPropertyValue('font-size')
+            };
+        """)
+        if styles is None:
+            raise NoSuchElementException("municipio-label or municipio-value not found")
+        font_size = styles["fontSize"]
+        text_transform = styles["textTransform"]
+        
+        # Label should be small and uppercase
+        assert "uppercase" in text_transform.lower()
+        
+        # Font size should be smaller than value
+        value_font_size = styles["valueFontSize"]
+        
+        # Convert to numbers for comparison
+        label_size = float(font_size.replace("px", ""))
+        value_size = float(value_font_size.replace("px", ""))
+        
+        assert label_size < value_size, (
+            f"Label ({label_size}px) should be smaller than value ({value_size}px)"
+        )
+        
+        print(f"✓ Labels properly styled (uppercase, {label_size}px vs value {value_size}px)")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Label styling check failed: {e}")
+
+
+@pytest.mark.parametrize("viewport", [MOBILE_VIEWPORT], ids=["mobile"], indirect=True)
+def test_06_responsive_mobile_layout(page):
+    """Test visual hierarchy on mobile viewport"""
+    try:
+        # Location cards should still be present and prominent
+        location_section = page.find_element(By.CLASS_NAME, "location-highlights")
+        assert location_section is not None
+        
+        # Cards should stack vertically (single column)
+        municipio_card = _parent(page, "municipio-value")
+        bairro_card = _parent(page, "bairro-value")
+        # The page may predate the resize; wait for the cards to reflow
+        _wait_until(
+            page,
+            lambda _: bairro_card.location['y'] > municipio_card.location['y']
+        )
+        municipio_pos = municipio_card.location
+        bairro_pos = bairro_card.location
+        
+        # Bairro should be below município (higher Y coordinate)
+        assert bairro_pos['y'] > municipio_pos['y'], "Cards should stack vertically on mobile"
+        
+        # Cards should still be larger than buttons
+        card_height = municipio_card.size['height']
+        restaurant_btn = page.find_element(By.ID, "findRestaurantsBtn")
+        button_height = restaurant_btn.size['height']
+        
+        assert card_height > button_height
+        
+        print("✓ Mobile layout maintains visual hierarchy")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Mobile layout check failed: {e}")
+
+
+@pytest.mark.parametrize(
+    "viewport",
+    [MOBILE_VIEWPORT, TABLET_VIEWPORT, DESKTOP_VIEWPORT],
+    ids=["mobile", "tablet", "desktop"],
+    indirect=True,
+)
+def test_07_responsive_layout(page, viewport):
+    """Test that both location cards stay visible at each viewport"""
+    try:
+        # Location cards should be side by side or responsive
+        municipio_card = _parent(page, "municipio-value")
+        bairro_card = _parent(page, "bairro-value")
+        
+        # Both should be visible
+        assert municipio_card.is_displayed()
+        assert bairro_card.is_displayed()
+        
+        print(f"✓ {viewport[0]}x{viewport[1]} layout maintains visual hierarchy")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Layout check at {viewport[0]}x{viewport[1]} failed: {e}")
+
+
+def test_08_hover_state_cards(page):
+    """Test hover state on location cards"""
+    try:
+        municipio_card = _parent(page, "municipio-value")
+        
+        # Get initial box-shadow
+        initial_shadow = municipio_card.value_of_css_property("box-shadow")
+        
+        # Hover over card
+        actions = ActionChains(page)
+        actions.move_to_element(municipio_card).perform()
+        # Wait for the transition (it may never fire in headless mode)
+        _wait_until(
+            page,
+            lambda _: municipio_card.value_of_css_property("box-shadow") != initial_shadow,
+            timeout=0.3,
+        )
+        
+        # Get hover box-shadow
+        hover_shadow = municipio_card.value_of_css_property("box-shadow")
+        
+        # Shadow should change on hover (increased elevation)
+        # Note: In headless mode, hover may not trigger, so this is a soft check
+        # We just verify that hover styles are defined
+        print(f"✓ Hover states defined (initial: {initial_shadow[:50]}...)")
+    except (NoSuchElementException, Exception) as e:
+        # Hover may not work in headless mode, so we make this a warning
+        print(f"⚠ Hover state check skipped (headless mode): {e}")
+
+
+def test_10_css_file_loaded(page):
+    """Test that location-highlights.css is loaded"""
+    try:
+        # Ask the browser whether it fetched the file, which also covers
+        # @import and dynamically added stylesheets; the <link> check
+        # catches a full resource timing buffer
+        css_loaded = page.execute_script("""
+            const isTarget = url => url.includes('location-highlights.css');
+            return performance.getEntriesByType('resource').some(e => isTarget(e.name))
+                || Array.from(document.querySelectorAll('link')).some(l => isTarget(l.href));
+        """)
+        
+        assert css_loaded, "location-highlights.css should be loaded in the page"
+        
+        print("✓ location-highlights.css is loaded")
+    except AssertionError as e:
+        pytest.fail(f"CSS file check failed: {e}")
+
+
+def test_11_visual_hierarchy_order(page):
+    """Test that elements appear in correct visual order"""
+    try:
+        # Get Y positions of key elements
+        location_section = page.find_element(By.CLASS_NAME, "location-highlights")
+        buttons_nav = page.find_element(By.CSS_SELECTOR, "nav[aria-label='Ações da página']")
+        
+        location_y = location_section.location['y']
+        buttons_y = buttons_nav.location['y']
+        
+        # Buttons should come BEFORE location cards in the current layout
+        # (but location cards should be MORE visually prominent despite position)
+        # This test just ensures both elements exist and are positioned
+        
+        assert location_y is not None
+        assert buttons_y is not None
+        
+        print(f"✓ Visual hierarchy established (cards at y={location_y}, buttons at y={buttons_y})")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Visual order check failed: {e}")
+
+
+def test_12_contrast_ratio_sufficient(page):
+    """Test that text contrast on cards is sufficient"""
+    try:
+        municipio_card = _parent(page, "municipio-value")
+        
+        # Get background and text colors, checking the text color in the browser
+        result = page.execute_script("""
+            const style = getComputedStyle(arguments[0]);
+            const color = style.getPropertyValue('color');
+            const channels = (color.match(/\\d+/g) || []).slice(0, 3).map(Number);
+            return {
+                background: style.getPropertyValue('background-color'),
+                color: color,
+                // All channels should be high (white)
+                light: !color.toLowerCase().includes('rgb') || channels.length < 3
+                    || channels.every(c => c > 200)
+            };
+        """, municipio_card)
+        bg_color = result["background"]
+        text_color = result["color"]
+        
+        # Check that text is white or very light
+        assert result["light"], f"Text should be white or very light ({text_color})"
+        
+        print(f"✓ Text contrast sufficient (bg: {bg_color}, text: {text_color})")
+    except (NoSuchElementException, AssertionError) as e:
+        pytest.fail(f"Contrast check failed: {e}")